@@ -1,148 +1,74 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
 from datetime import datetime
-import io
+import uuid
 
-# CSV 다운로드 함수 
-def create_csv_files(df, filename_prefix):
-    """평가 템플릿 데이터를 3개의 CSV 파일로 생성"""
-    try:
-        csv_files = {}
-        
-        # 파일 1: 출제자 평가 템플릿
-        template_csv = df.to_csv(index=False, encoding='utf-8-sig')
-        csv_files['template'] = {
-            'data': template_csv,
-            'filename': f"{filename_prefix}_출제자평가템플릿.csv"
-        }
-        
-        # 파일 2: 평가 기준표
-        criteria_data = []
-        for _, row in df.iterrows():
-            criteria_row = {
-                '대분류': row.get('대분류', ''),
-                '중분류': row.get('중분류', ''),
-                '소분류': row.get('소분류', ''),
-                '상 (90-100점)': row.get('상', ''),
-                '중 (70-89점)': row.get('중', ''),
-                '하 (50-69점)': row.get('하', ''),
-                '미달 (0-49점)': row.get('배점 X', ''),
-                '비고': ''
-            }
-            criteria_data.append(criteria_row)
-        
-        criteria_df = pd.DataFrame(criteria_data)
-        criteria_csv = criteria_df.to_csv(index=False, encoding='utf-8-sig')
-        csv_files['criteria'] = {
-            'data': criteria_csv,
-            'filename': f"{filename_prefix}_평가기준표.csv"
-        }
-        
-        # 파일 3: 점수 집계표
-        score_data = []
-        for _, row in df.iterrows():
-            score_row = {
-                '수험생명': '',
-                '대분류': row.get('대분류', ''),
-                '중분류': row.get('중분류', ''),
-                '소분류': row.get('소분류', ''),
-                '배점': row.get('배점', ''),
-                '획득점수': '',
-                '평가자': '',
-                '평가일시': '',
-                '비고': ''
-            }
-            score_data.append(score_row)
-        
-        score_df = pd.DataFrame(score_data)
-        score_csv = score_df.to_csv(index=False, encoding='utf-8-sig')
-        csv_files['score'] = {
-            'data': score_csv,
-            'filename': f"{filename_prefix}_점수집계표.csv"
-        }
-        
-        return True, csv_files
-        
-    except Exception as e:
-        return False, f"CSV 파일 생성 중 오류가 발생했습니다: {str(e)}"
-
-# 엑셀 파일 생성 함수
-def create_excel_file(track_name=""):
-    """평가 템플릿과 문제 템플릿을 포함한 엑셀 파일 생성"""
-    try:
-        # 파일명 설정
-        if track_name.strip():
-            filename = f"{track_name.strip()}_{datetime.now().strftime('%y%m%d')}.xlsx"
-        else:
-            filename = f"스파르타_평가시트_{datetime.now().strftime('%y%m%d')}.xlsx"
-        
-        # BytesIO 객체 생성
-        output = io.BytesIO()
-        
-        # ExcelWriter 생성
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # 평가 템플릿 시트
-            if "template_table" in st.session_state and not st.session_state["template_table"].empty:
-                template_df = st.session_state["template_table"].copy()
-                template_df.to_excel(writer, sheet_name='출제자_평가_템플릿', index=False)
-
-            # 문제 템플릿 시트
-            if "problem_table" in st.session_state and not st.session_state["problem_table"].empty:
-                problem_df = st.session_state["problem_table"].copy()
-                problem_df.to_excel(writer, sheet_name='출제자_문제_템플릿', index=False)
-
-            # 문제 템플릿 시트
-            if "problem_table" in st.session_state and not st.session_state["problem_table"].empty:
-                problem_df = st.session_state["problem_table"].copy()
-                problem_df.to_excel(writer, sheet_name='검수자_문제_템플릿', index=False)        
-            
-            # 빈 시트들이 없다면 기본 템플릿 생성
-            if ("template_table" not in st.session_state or st.session_state["template_table"].empty) and \
-               ("problem_table" not in st.session_state or st.session_state["problem_table"].empty):
-                # 기본 평가 템플릿
-                default_template = pd.DataFrame({
-                    "대분류": ["예시"],
-                    "중분류": ["예시"],
-                    "소분류": ["예시 평가 항목"],
-                    "평가 내용": ["평가 내용을 입력하세요"],
-                    "배점": [10],
-                    "상": ["상급 기준"],
-                    "중": ["중급 기준"],
-                    "하": ["하급 기준"],
-                    "배점 X": ["미달 기준"]
-                })
-                default_template.to_excel(writer, sheet_name='출제자_평가_템플릿', index=False)
-                
-                # 기본 문제 템플릿
-                default_problem = pd.DataFrame({
-                    "문제명": ["예시 문제"],
-                    "하위 기능": [""],
-                    "소분류": ["예시 평가 항목"],
-                    "평가 내용": ["평가 내용을 입력하세요"],
-                    "진행상황": ["진행중"],
-                    "유형": ["실무과제"],
-                    "난이도": ["중"],
-                    "출제 목적": [""],
-                    "문제 설명": [""],
-                    "필수 요구사항": [""],
-                    "선택 요구사항(가산점)": [""],
-                    "제약 조건": [""],
-                    "요구 기술 스택 및 툴": [""],
-                    "제출 형식": [""],
-                    "예상 소요시간": [""],
-                    "문제 노션 링크": [""],
-                    "답안 노션 링크": [""],
-                    "출제자 메모": [""]
-                })
-                default_problem.to_excel(writer, sheet_name='출제자_문제_템플릿', index=False)
-        
-        output.seek(0)
-        return True, output.getvalue(), filename
-        
-    except Exception as e:
-        return False, None, f"엑셀 파일 생성 중 오류가 발생했습니다: {str(e)}"
+from compact_tables import compact, memory_report, plain
+from export_cache import cached_excel_file
+from exports import create_csv_zip
+from problem_sync import build_problem_index, sync_problem_rows
+from profiling import Profiler, dataframe_memory, is_enabled
+from rubric_catalog import load_catalogs
+from rubric_search import SEARCH_PAGE_SIZE
+from score_aggregation import aggregate_scores
+from schema import TEMPLATE_COLUMNS
+from session_store import editor_row_labels, get_store
+from template_table import add_template_rows, build_key_index, next_row_label
+from workbook_import import import_workbooks
+
+# 평가 템플릿 추가 함수
+def add_to_template(keys):
+    """(대분류, 중분류, 소분류) 키 기준으로 평가 템플릿에 없는 행만 추가"""
+    if "template_table" not in st.session_state:
+        st.session_state["template_table"] = pd.DataFrame(columns=TEMPLATE_COLUMNS)
+    # 키 인덱스는 표를 직접 편집했을 때만 다시 만듦
+    if st.session_state.get("template_key_index") is None:
+        st.session_state["template_key_index"] = build_key_index(st.session_state["template_table"])
+    with profiler.span("state:template_add"):
+        table, added = add_template_rows(
+            st.session_state["template_table"], st.session_state["template_key_index"], keys
+        )
+        # 분류 열은 add_template_rows가 프로세스 공용 카테고리로 맞춰 둠 (추가 행 수만큼만 변환)
+        st.session_state["template_table"] = table
+        if added:
+            save_table("template_table", table, changed=table.index[-added:])
+            mark_problem_dirty(table["소분류"].iloc[-added:])
+    return added
+
+def show_add_result(added):
+    """추가 결과 메시지 표시"""
+    if added:
+        st.success(f"{added}개 항목이 평가 템플릿에 추가되었습니다!")
+    else:
+        st.info("선택한 항목이 이미 평가 템플릿에 있습니다.")
+
+def editor_changed(key):
+    """데이터 편집기에 이번 실행에서 반영된 수정/추가/삭제가 있는지 확인"""
+    state = st.session_state.get(key) or {}
+    return bool(state.get("edited_rows") or state.get("added_rows") or state.get("deleted_rows"))
+
+def mark_problem_dirty(keys):
+    """다음 '문제 만들기' 때 문제 템플릿에 반영할 소분류 기록 (None이면 이미 전체를 맞춰 볼 예정)"""
+    dirty = st.session_state.get("problem_sync_dirty")
+    if dirty is not None:
+        dirty.update(key for key in keys if isinstance(key, str))
+
+# 세션 표 저장 함수
+def save_table(table_name, df, changed=(), deleted=(), replace=False):
+    """바뀐 행만 로컬 저장소에 기록 예약 (실제 쓰기는 백그라운드에서 모아서 처리)"""
+    get_store().stage(st.session_state["session_id"], table_name, df, changed, deleted, replace)
+
+def apply_editor_changes(table_name, table, edited_df, editor_key):
+    """RangeIndex로 편집한 결과에 세션 표의 행 레이블을 다시 붙이고 수정/추가/삭제된 행만 저장"""
+    # 세션 표의 레이블은 행 단위 저장용 식별자라 삭제 후 불연속일 수 있음. 그대로 편집기에 넘기면
+    # 편집기가 레이블 열을 필수 입력으로 보고 새 행마다 레이블을 직접 입력하게 하므로 레이블은 여기서만 다룸
+    with profiler.span("state:autosave"):
+        labels, changed, deleted = editor_row_labels(
+            table.index, st.session_state.get(editor_key), next_row_label(table)
+        )
+        edited_df = edited_df.set_axis(labels)
+        save_table(table_name, edited_df, changed, deleted)
+    return edited_df, changed, deleted
 
 # 페이지 설정
 st.set_page_config(
@@ -156,10 +82,29 @@ st.set_page_config(
 st.title("🧑🏻‍🎓 스파르타 취업 역량 평가")
 st.markdown("---")
 
+# 성능 계측 (URL에 ?debug=1 또는 KDT_PROFILE=1일 때만 기록)
+if "profiler" not in st.session_state:
+    st.session_state["profiler"] = Profiler()
+profiler = st.session_state["profiler"]
+profiler.begin_run(is_enabled(st.query_params))
+
 # 세션 상태 초기화
 if 'current_page' not in st.session_state:
     st.session_state.current_page = "평가표"
 
+# 세션 복원: URL의 sid로 새로고침/서버 재시작 후에도 작성하던 표를 다시 불러옴
+if "sid" not in st.query_params:
+    st.query_params["sid"] = uuid.uuid4().hex
+if st.session_state.get("session_id") != st.query_params["sid"]:
+    st.session_state["session_id"] = st.query_params["sid"]
+    with profiler.span("state:restore"):
+        for table_name, table in get_store().load_tables(st.session_state["session_id"]).items():
+            st.session_state[table_name] = compact(table)
+    st.session_state["template_key_index"] = None
+    # 복원한 표는 마지막 동기화 이후 바뀐 소분류를 모르므로 다음 '문제 만들기'는 전체를 맞춰 봄
+    st.session_state["problem_key_index"] = None
+    st.session_state["problem_sync_dirty"] = None
+
 # 버튼 메뉴
 if st.sidebar.button("평가표", use_container_width=True):
     st.session_state.current_page = "평가표"
@@ -167,35 +112,119 @@ if st.sidebar.button("출제자 평가 템플릿", use_container_width=True):
     st.session_state.current_page = "출제자 평가 템플릿"
 if st.sidebar.button("출제자 문제 템플릿", use_container_width=True):
     st.session_state.current_page = "출제자 문제 템플릿"
+if st.sidebar.button("점수 집계", use_container_width=True):
+    st.session_state.current_page = "점수 집계"
+if st.sidebar.button("결과 대시보드", use_container_width=True):
+    st.session_state.current_page = "결과 대시보드"
 
-# 시트 만들기 버튼 추가
+# 파일 생성/가져오기 패널 (여기서의 입력은 이 패널만 다시 실행)
 st.sidebar.markdown("---")
-st.sidebar.markdown("### 📄 파일 생성")
-
-# 트랙명을 사이드바에서 입력받기
-sidebar_track_name = st.sidebar.text_input(
-    "트랙명 (파일명용)",
-    value="",
-    placeholder="예: PM, UXUI, 그래픽디자이너",
-    help="엑셀 파일명에 사용될 트랙명을 입력하세요"
-)
 
-if st.sidebar.button("📊 시트 만들기", use_container_width=True, type="primary"):
-    success, excel_data, filename = create_excel_file(sidebar_track_name)
+@st.fragment
+@profiler.fragment("fragment:export_panel")
+def export_panel():
+    """트랙명 입력, 시트/CSV 만들기, 검토한 시트 가져오기"""
+    st.markdown("### 📄 파일 생성")
+
+    # 트랙명을 사이드바에서 입력받기
+    sidebar_track_name = st.text_input(
+        "트랙명 (파일명용)",
+        value="",
+        placeholder="예: PM, UXUI, 그래픽디자이너",
+        help="엑셀 파일명에 사용될 트랙명을 입력하세요"
+    )
+
+    if st.button("📊 시트 만들기", use_container_width=True, type="primary"):
+        # 내용이 바뀌지 않았다면 캐시된 파일을 바로 사용
+        with profiler.span("export:excel"):
+            success, excel_data, filename = cached_excel_file(
+                plain(st.session_state.get("template_table")), plain(st.session_state.get("problem_table")),
+                sidebar_track_name
+            )
     
-    if success:
-        st.sidebar.download_button(
-            label="📥 엑셀 파일 다운로드",
-            data=excel_data,
-            file_name=filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
+        if success:
+            st.download_button(
+                label="📥 엑셀 파일 다운로드",
+                data=excel_data,
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
+            st.success("엑셀 파일이 생성되었습니다! 다운로드 버튼을 클릭하세요.")
+        else:
+            st.error(f"엑셀 파일 생성 실패: {filename}")
+
+    if st.button("🗂️ CSV 만들기", use_container_width=True):
+        if "template_table" in st.session_state and not st.session_state["template_table"].empty:
+            prefix = sidebar_track_name.strip() or "스파르타_평가시트"
+            with profiler.span("export:csv"):
+                success, zip_data, filename = create_csv_zip(
+                    plain(st.session_state["template_table"]), f"{prefix}_{datetime.now().strftime('%y%m%d')}"
+                )
+
+            if success:
+                st.download_button(
+                    label="📥 CSV 묶음 다운로드",
+                    data=zip_data,
+                    file_name=filename,
+                    mime="application/zip",
+                    use_container_width=True
+                )
+                st.success("평가 템플릿, 평가 기준표, 점수 집계표 CSV가 생성되었습니다!")
+            else:
+                st.error(f"CSV 파일 생성 실패: {filename}")
+        else:
+            st.warning("평가 템플릿이 비어 있습니다. 먼저 '평가표' 페이지에서 항목을 추가해주세요.")
+
+    # 검토가 끝난 시트 다시 가져오기 (소분류 기준으로 현재 표에 병합)
+    with st.expander("📥 검토한 시트 가져오기"):
+        import_files = st.file_uploader(
+            "내보냈던 엑셀 파일(xlsx)을 올려주세요",
+            type=["xlsx"],
+            accept_multiple_files=True,
+            key="import_files"
         )
-        st.sidebar.success("엑셀 파일이 생성되었습니다! 다운로드 버튼을 클릭하세요.")
-    else:
-        st.sidebar.error(f"엑셀 파일 생성 실패: {filename}")
+        if st.button("가져오기", use_container_width=True):
+            if import_files:
+                with st.spinner("시트를 읽는 중입니다..."), profiler.span("import:workbooks"):
+                    summary = import_workbooks(
+                        # 업로드 파일 객체를 그대로 넘겨 내용을 다시 복사하지 않음
+                        [(f.name, f) for f in import_files],
+                        plain(st.session_state.get("template_table")),
+                        plain(st.session_state.get("problem_table"))
+                    )
+                for table_name, part in (("template_table", summary["template"]), ("problem_table", summary["problem"])):
+                    if part and part["changed"]:
+                        st.session_state[table_name] = compact(part["table"])
+                        save_table(table_name, part["table"], changed=part["changed"])
+                # 병합으로 분류 값이 바뀌었을 수 있으니 키 인덱스는 다음 추가 때 다시 만들고
+                # 다음 '문제 만들기'는 전체를 맞춰 봄
+                st.session_state["template_key_index"] = None
+                st.session_state["problem_key_index"] = None
+                st.session_state["problem_sync_dirty"] = None
+                counts = [
+                    f"{label} {part['updated']}행 수정, {part['added']}행 추가"
+                    for label, part in (("평가 템플릿", summary["template"]), ("문제 템플릿", summary["problem"]))
+                    if part
+                ]
+                st.session_state["import_result"] = (
+                    summary["errors"], f"{summary['files']}개 파일을 가져왔습니다. " + ", ".join(counts)
+                )
+                # 열려 있는 편집기에도 병합 결과가 보이도록 앱 전체를 다시 실행
+                st.rerun()
+            else:
+                st.warning("가져올 파일을 먼저 올려주세요.")
+        if "import_result" in st.session_state:
+            errors, message = st.session_state.pop("import_result")
+            for error in errors:
+                st.error(error)
+            st.success(message)
+
+with st.sidebar:
+    export_panel()
 
 page = st.session_state.current_page
+page_timer = profiler.start(f"page:{page}")
 
 if page == "평가표":
     st.header("평가표")
@@ -207,125 +236,67 @@ if page == "평가표":
     #     3. "평가 템플릿에 추가" 버튼 클릭
     # """)
     
-    # 개발/비개발 토글
-    job_type = st.selectbox("과목 선택", ["개발", "비개발"])
-    
-    if job_type == "개발":
-        st.subheader("개발 평가표")
-        # 계층 구조 정의 (예시)
-        dev_hierarchy = {
-            '코드': {
-                '요구사항 해석': ['프로젝트 과제 목적에 맞게 구현했는가', '제공된 입출력 데이터를 통과하는가'],
-                '알고리즘/로직': ['기본 문법(반복문, 조건문 등) 적절히 활용했는가', '효율적인 알고리즘 및 자료구조 사용했는가'],
-                '코드 품질 및 최적화': ['적절한 함수 분리 및 모듈화가 되어있는가', '시간/공간복잡도 개선 노력이 있었는가', '중복 코드를 최소화하여 간결하게 작성했는가'],
-                '예외 처리': ['예상 가능한 예외 사항을 고려했는가', 'try-catch-finally 구문을 적절히 사용했는가']
-            },
-            '프레임워크': {
-                '구조 설계 이해도': ['프레임워크 구조 특성을 이해하고 적용했는가', '디렉토리 구조를 일관성있게 설계했는가'],
-                '기능 구현 방식 적절성': ['프레임워크 방식에 맞춰 기능을 구현했는가', '내장 기능과 라이브러리를 알맞게 활용했는가'],
-                '역할 분리 및 재사용성': ['로직, 서비스 등을 목적에 따라 분리했는가', '컴포넌트화, 모듈화 등을 통해 재사용을 할 수 있는가'],
-                '상태 및 흐름 관리': ['상태 관리나 요청-응답 흐름을 일관되게 처리했는가', '프레임워크에 맞는 상태/라우팅 방식을 사용했는가'],
-                '설정 및 의존성 관리': ['환경설정 파일(.env, web.xml 등)을 적절히 구성했는가', '외부 라이브러리, 모듈 의존성을 관리했는가'],
-            }
-        }
-        # 표로 변환
-        rows = []
-        for 대분류, 중분류_dict in dev_hierarchy.items():
-            for 중분류, 소분류_list in 중분류_dict.items():
-                for 소분류 in 소분류_list:
-                    rows.append({'대분류': 대분류, '중분류': 중분류, '소분류': 소분류})
-        df = pd.DataFrame(rows)
+    @st.fragment
+    @profiler.fragment("fragment:catalog_picker")
+    def catalog_picker():
+        """과목 선택과 평가 항목 추가 (선택/추가는 이 영역만 다시 실행)"""
+        # 과목 토글 (rubrics/ 디렉토리의 평가표 파일 기준)
+        with profiler.span("catalog:load"):
+            catalogs = load_catalogs()
+        job_type = st.selectbox("과목 선택", list(catalogs.keys()))
+        catalog = catalogs[job_type]
 
-    else:
-        st.subheader("비개발 평가표")
-        # 계층 구조 정의 (예시)
-        biz_hierarchy = {
-            '기획': {
-                '문제 정의': ['해결해야 할 문제와 핵심 이슈를 제대로 설정했는가'],
-                '요구사항 분석': ['고객/시장/업무의 요구사항을 잘 분석했는가', '다양한 관계자의 니즈를 반영했는가', '충돌되는 요구사항을 조율했는가'],
-                '목표 설정': ['달성 가능한 목표/지표를 설계했는가', '핵심 기능 또는 가치 요소를 제대로 도출했는가'],
-                '전략 및 기획': ['목표를 달성하기 위한 구체적인 전략을 수립했는가', '전개 방식이 일관되고 설득력있는 전략/기획인가'],
-            },
-            '완성도': {
-                '결과물 완성도': ['계획한 목표를 달성했는가', '목표 달성 과정이 설득력있게 정리되었는가'],
-                '문제 해결력': ['정성적/정량적 데이터를 적절히 활용했는가', '데이터 해석이 설득력을 갖고 판단의 근거로 기능했는가'],
-                '전문성': ['직무에 맞는 툴을 목적에 맞게 활용했는가', '직무 용어 및 개념을 올바르게 사용했는가'],
-                '성과 분석': ['결과물에 대한 성과 분석을 수행했는가', '문제점과 긍정적인 성과 모두를 도출했는가'],
-                '개선 제안': ['수행 과정을 바탕으로 개선 방향을 논리적으로 제시했는가']
-            },
-            '소프트스킬': {
-                '협업 및 전달력': ['다른 직무 담당자와의 협업을 고려했는가', '기획 의도, 결과물을 명확하게 설명했는가'],
-                '창의성': ['결과물을 도출하기 위한 과정이 창의적으로 진행됐는가', '다른 수험생들과 비교되는 지점이 있는가'],
-            }
-        }
-        # 표로 변환
-        rows = []
-        for 대분류, 중분류_dict in biz_hierarchy.items():
-            for 중분류, 소분류_list in 중분류_dict.items():
-                for 소분류 in 소분류_list:
-                    rows.append({'대분류': 대분류, '중분류': 중분류, '소분류': 소분류})
-        df = pd.DataFrame(rows)
+        st.subheader(f"{catalog.name} 평가표")
+        # 계층 구조와 표는 프로세스당 한 번만 만들어 캐시된 것을 사용
+        df = catalog.df
 
-    
-    # 평가 표 편집 가능하게 표시
-    # 드롭다운 옵션 준비
-    dev_major_options = list(dev_hierarchy.keys()) if job_type == "개발" else []
-    dev_mid_options = sum([list(v.keys()) for v in dev_hierarchy.values()], []) if job_type == "개발" else []
-    dev_sub_options = sum([sum([vv for vv in v.values()], []) for v in dev_hierarchy.values()], []) if job_type == "개발" else []
-    biz_major_options = list(biz_hierarchy.keys()) if job_type == "비개발" else []
-    biz_mid_options = sum([list(v.keys()) for v in biz_hierarchy.values()], []) if job_type == "비개발" else []
-    biz_sub_options = sum([sum([vv for vv in v.values()], []) for v in biz_hierarchy.values()], []) if job_type == "비개발" else []
-
-    # 각 표에 맞는 옵션 지정
-    if job_type == "개발":
-        col_config = {
-            "대분류": st.column_config.SelectboxColumn("대분류", options=dev_major_options, required=True),
-            "중분류": st.column_config.SelectboxColumn("중분류", options=dev_mid_options, required=True),
-            "소분류": st.column_config.TextColumn("소분류", width="large"),
-        }
-    else:
+        # 평가 표 편집 가능하게 표시
+        # 드롭다운 옵션 지정
         col_config = {
-            "대분류": st.column_config.SelectboxColumn("대분류", options=biz_major_options, required=True),
-            "중분류": st.column_config.SelectboxColumn("중분류", options=biz_mid_options, required=True),
+            "대분류": st.column_config.SelectboxColumn("대분류", options=catalog.major_options, required=True),
+            "중분류": st.column_config.SelectboxColumn("중분류", options=catalog.mid_options, required=True),
             "소분류": st.column_config.TextColumn("소분류", width="large"),
         }
 
-    st.dataframe(df, use_container_width=True)
+        st.dataframe(df, use_container_width=True)
 
-    # 멀티셀렉트로 행 선택 (인덱스 기준)
-    selected_idx = st.multiselect(
-        "추가할 행(들)을 선택하세요",
-        options=df.index,
-        format_func=lambda x: f"{x+1}행: {df.loc[x, '대분류']} / {df.loc[x, '중분류']} / {df.loc[x, '소분류']}"
-    )
+        # 검색어로 평가 항목 찾기 (n-gram 색인에서 필요한 페이지만 가져옴)
+        search_index = catalog.search_index
+        search_col, page_col = st.columns([4, 1])
+        query = search_col.text_input("평가 항목 검색", placeholder="예: 데이터, 협업, 요구사항 해석")
+        page_no = page_col.number_input(
+            "페이지", min_value=1, value=1, step=1, key=f"rubric_page:{catalog.name}:{query}"
+        )
+        with profiler.span("catalog:search"):
+            positions, total = search_index.search(query, (page_no - 1) * SEARCH_PAGE_SIZE, SEARCH_PAGE_SIZE)
+        pages = max(1, -(-total // SEARCH_PAGE_SIZE))
+        st.caption(f"검색 결과 {total:,}건 · {page_no}/{pages} 페이지")
 
-    # 9개 열 구성 (앞 3개: 대분류, 중분류, 소분류)
-    template_columns = [
-        "대분류", "중분류", "소분류",
-        "평가 내용", "배점", "상", "중", "하", "배점 X"
-    ]
-    if st.button("평가 템플릿에 추가"):
-        if selected_idx:
-            selected = df.loc[selected_idx]
-            selected_template = pd.DataFrame({
-                "대분류": selected["대분류"].values,
-                "중분류": selected["중분류"].values,
-                "소분류": selected["소분류"].values,
-                "평가 내용": "",
-                "배점": "",
-                "상": "",
-                "중": "",
-                "하": "",
-                "배점 X": ""
-            })
-            if "template_table" not in st.session_state:
-                st.session_state["template_table"] = pd.DataFrame(columns=template_columns)
-            st.session_state["template_table"] = pd.concat([
-                st.session_state["template_table"], selected_template
-            ], ignore_index=True).drop_duplicates()
-            st.success("평가 템플릿에 추가되었습니다!")
-        else:
-            st.warning("추가할 행을 먼저 선택해 주세요.")
+        # 멀티셀렉트로 행 선택 (현재 페이지 결과 중에서, 표시 문구는 색인에 미리 계산된 것 사용)
+        selected_idx = st.multiselect(
+            "추가할 행(들)을 선택하세요",
+            options=positions.tolist(),
+            format_func=search_index.label,
+            key=f"rubric_pick:{catalog.name}:{query}:{page_no}"
+        )
+
+        if st.button("평가 템플릿에 추가"):
+            if selected_idx:
+                selected = df.iloc[selected_idx]
+                added = add_to_template(zip(selected["대분류"], selected["중분류"], selected["소분류"]))
+                show_add_result(added)
+            else:
+                st.warning("추가할 행을 먼저 선택해 주세요.")
+
+        # 대분류/중분류 단위로 한 번에 추가
+        bulk_col1, bulk_col2 = st.columns(2)
+        bulk_major = bulk_col1.selectbox("대분류 전체 추가", catalog.major_options)
+        bulk_mid = bulk_col2.selectbox("중분류", ["전체"] + catalog.mids_by_major[bulk_major])
+        if st.button("선택한 분류 전체 추가"):
+            added = add_to_template(catalog.keys_under(bulk_major, None if bulk_mid == "전체" else bulk_mid))
+            show_add_result(added)
+
+    catalog_picker()
 
 elif page == "출제자 평가 템플릿":
     st.header("출제자 평가 템플릿")
@@ -341,64 +312,79 @@ elif page == "출제자 평가 템플릿":
     #     7. 배점 X: 0점일때의 답안의 기준
     # """)
 
-    if "template_table" in st.session_state:
-        # 텍스트 입력 가능한 컬럼 설정
-        col_config = {
-            "평가 내용": st.column_config.TextColumn("평가 내용", width="medium"),
-            "배점": st.column_config.NumberColumn("배점", width="small", format="%d"),
-            "상": st.column_config.TextColumn("상", width="medium"),
-            "중": st.column_config.TextColumn("중", width="medium"),
-            "하": st.column_config.TextColumn("하", width="medium"),
-            "배점 X": st.column_config.TextColumn("배점 X", width="medium"),
-        }
+    @st.fragment
+    @profiler.fragment("fragment:template_editor")
+    def template_editor():
+        """평가 템플릿 편집기와 문제 만들기 (셀 편집은 이 편집기만 다시 실행)"""
+        if "template_table" in st.session_state:
+            # 텍스트 입력 가능한 컬럼 설정
+            col_config = {
+                "평가 내용": st.column_config.TextColumn("평가 내용", width="medium"),
+                "배점": st.column_config.NumberColumn("배점", width="small", format="%d"),
+                "상": st.column_config.TextColumn("상", width="medium"),
+                "중": st.column_config.TextColumn("중", width="medium"),
+                "하": st.column_config.TextColumn("하", width="medium"),
+                "배점 X": st.column_config.TextColumn("배점 X", width="medium"),
+            }
         
-        # 데이터 편집기
-        edited_df = st.data_editor(
-            st.session_state["template_table"],
-            column_config=col_config,
-            use_container_width=True,
-            num_rows="dynamic"
-        )
+            # 데이터 편집기
+            # 편집기에는 RangeIndex와 일반 문자열 열로 넘김 (카테고리 열은 편집기에서 선택 상자로 바뀜)
+            table = st.session_state["template_table"]
+            before_df = plain(table).reset_index(drop=True)
+            with profiler.span("editor:template"):
+                edited_df = st.data_editor(
+                    before_df,
+                    column_config=col_config,
+                    use_container_width=True,
+                    num_rows="dynamic",
+                    key="template_editor"
+                )
         
-        # 편집된 데이터를 세션 상태에 저장
-        st.session_state["template_table"] = edited_df
+            # 편집된 데이터를 세션 상태에 저장
+            # 행을 직접 고치거나 추가/삭제했다면 키 인덱스를 다음 추가 때 다시 만듦
+            if editor_changed("template_editor"):
+                st.session_state["template_key_index"] = None
+                edited_df, changed, deleted = apply_editor_changes(
+                    "template_table", table, edited_df, "template_editor"
+                )
+                st.session_state["template_table"] = compact(edited_df)
+                # 고친 행은 바뀌기 전/후 소분류 모두, 삭제한 행은 원래 소분류를 다시 맞춰 볼 대상으로 기록
+                touched = table.index.intersection([*changed, *deleted])
+                mark_problem_dirty([*edited_df.loc[changed, "소분류"], *table.loc[touched, "소분류"]])
            
-    else:
-        st.info("아직 추가된 항목이 없습니다. 먼저 '평가표' 페이지에서 항목을 추가해주세요.")
-
-    # 문제 만들기 버튼 (현재 평가 템플릿을 문제 템플릿으로 복사)
-    if "template_table" in st.session_state:
-        if st.button("문제 만들기", key="make_problem"):
-            # 문제 템플릿 열 정의
-            problem_columns = [
-                "문제명", "하위 기능", "소분류", "평가 내용", "진행상황", "유형", "난이도", "출제 목적", "문제 설명",
-                "필수 요구사항", "선택 요구사항(가산점)", "제약 조건", "요구 기술 스택 및 툴", "제출 형식",
-                "예상 소요시간", "문제 노션 링크", "답안 노션 링크", "출제자 메모"
-            ]
-            # 평가 템플릿에서 소분류/평가 내용만 추출, 나머지는 공란
-            src_df = st.session_state["template_table"]
-            problem_df = pd.DataFrame({
-                "문제명": "",
-                "하위 기능": "",
-                "소분류": src_df["소분류"] if "소분류" in src_df.columns else "",
-                "평가 내용": src_df["평가 내용"] if "평가 내용" in src_df.columns else "",
-                "진행상황": "",
-                "유형": "",
-                "난이도": "",
-                "출제 목적": "",
-                "문제 설명": "",
-                "필수 요구사항": "",
-                "선택 요구사항(가산점)": "",
-                "제약 조건": "",
-                "요구 기술 스택 및 툴": "",
-                "제출 형식": "",
-                "예상 소요시간": "",
-                "문제 노션 링크": "",
-                "답안 노션 링크": "",
-                "출제자 메모": ""
-            })
-            st.session_state["problem_table"] = problem_df[problem_columns]
-            st.success("출제자 문제 템플릿이 생성되었습니다! 사이드바에서 '출제자 문제 템플릿'을 확인하세요.")
+        else:
+            st.info("아직 추가된 항목이 없습니다. 먼저 '평가표' 페이지에서 항목을 추가해주세요.")
+
+        # 문제 만들기 버튼 (평가 템플릿에서 바뀐 소분류만 문제 템플릿에 반영)
+        if "template_table" in st.session_state:
+            if st.button("문제 만들기", key="make_problem"):
+                # 새 소분류는 문제 행 추가, 평가 내용이 바뀐 행은 평가 내용만 고치고 작성한 다른 열은 유지
+                with profiler.span("state:problem_sync"):
+                    problem = st.session_state.get("problem_table")
+                    if st.session_state.get("problem_key_index") is None:
+                        st.session_state["problem_key_index"] = build_problem_index(problem)
+                    dirty = st.session_state.get("problem_sync_dirty")
+                    problem, added, updated, removed = sync_problem_rows(
+                        st.session_state["template_table"], problem, st.session_state["problem_key_index"], dirty
+                    )
+                    st.session_state["problem_table"] = compact(problem)
+                    st.session_state["problem_sync_dirty"] = set()
+                    if added or updated:
+                        save_table("problem_table", problem, changed=[*updated, *added])
+                    # 빠진 소분류 목록: 이번에 맞춰 본 소분류는 결과대로 다시 정하고 나머지는 그대로 둠
+                    flagged = set() if dirty is None else st.session_state.get("problem_removed", set()) - dirty
+                    st.session_state["problem_removed"] = flagged | set(removed)
+                st.success(
+                    f"출제자 문제 템플릿에 {len(added)}개 문제를 추가하고 {len(updated)}개 문제의 평가 내용을 고쳤습니다. "
+                    "사이드바에서 '출제자 문제 템플릿'을 확인하세요."
+                )
+                if removed:
+                    st.warning(
+                        f"평가 템플릿에서 빠진 소분류 {len(removed)}개의 문제는 지우지 않고 남겨 두었습니다: "
+                        + ", ".join(removed)
+                    )
+
+    template_editor()
 
 elif page == "출제자 문제 템플릿":
     st.header("출제자 문제 템플릿")
@@ -417,22 +403,116 @@ elif page == "출제자 문제 템플릿":
     #     10. 
     # """)
 
-    if "problem_table" in st.session_state and not st.session_state["problem_table"].empty:
-        # 진행상황 컬럼만 진행중/진행 완료 선택 가능한 Selectbox로, 나머지는 기본값
-        col_config = {
-            "진행상황": st.column_config.SelectboxColumn("진행상황", options=["진행중", "진행 완료"], required=True),
-            "유형": st.column_config.SelectboxColumn("유형", options=["코딩테스트", "실무과제", "지필평가"], required=True),
-            "난이도": st.column_config.SelectboxColumn("난이도", options=["상", "중", "하"], required=True),
-        }
-        edited_df = st.data_editor(
-            st.session_state["problem_table"],
-            column_config=col_config,
-            use_container_width=True,
-            num_rows="dynamic"
+    @st.fragment
+    @profiler.fragment("fragment:problem_editor")
+    def problem_editor():
+        """문제 템플릿 편집기 (셀 편집은 이 편집기만 다시 실행)"""
+        if "problem_table" in st.session_state and not st.session_state["problem_table"].empty:
+            # 진행상황 컬럼만 진행중/진행 완료 선택 가능한 Selectbox로, 나머지는 기본값
+            col_config = {
+                "진행상황": st.column_config.SelectboxColumn("진행상황", options=["진행중", "진행 완료"], required=True),
+                "유형": st.column_config.SelectboxColumn("유형", options=["코딩테스트", "실무과제", "지필평가"], required=True),
+                "난이도": st.column_config.SelectboxColumn("난이도", options=["상", "중", "하"], required=True),
+            }
+            # 문제 행 레이블도 소분류 동기화로 불연속일 수 있어 편집기에는 RangeIndex로 넘김
+            table = st.session_state["problem_table"]
+            before_df = plain(table).reset_index(drop=True)
+            with profiler.span("editor:problem"):
+                edited_df = st.data_editor(
+                    before_df,
+                    column_config=col_config,
+                    use_container_width=True,
+                    num_rows="dynamic",
+                    key="problem_editor"
+                )
+            if editor_changed("problem_editor"):
+                # 소분류를 고치거나 행을 지웠을 수 있으니 키 인덱스는 다음 '문제 만들기' 때 다시 만듦
+                st.session_state["problem_key_index"] = None
+                edited_df, _, _ = apply_editor_changes("problem_table", table, edited_df, "problem_editor")
+                st.session_state["problem_table"] = compact(edited_df)
+            # 평가 템플릿에서 빠졌지만 남겨 둔 문제 안내 (지울지는 작성자가 결정)
+            flagged = st.session_state.get("problem_removed")
+            if flagged:
+                remaining = sorted(set(edited_df["소분류"][edited_df["소분류"].isin(flagged)]))
+                if remaining:
+                    st.warning(
+                        f"평가 템플릿에서 빠진 소분류의 문제 {len(remaining)}개가 남아 있습니다: " + ", ".join(remaining)
+                    )
+        else:
+            st.info("아직 생성된 문제가 없습니다. '출제자 평가 템플릿'에서 '문제 만들기' 버튼을 눌러주세요.")
+
+    problem_editor()
+
+elif page == "점수 집계":
+    st.header("점수 집계")
+
+    uploaded_files = st.file_uploader(
+        "채점이 끝난 점수 집계표 파일(CSV/xlsx)을 올려주세요",
+        type=["csv", "xlsx"],
+        accept_multiple_files=True
+    )
+
+    if st.button("집계하기", type="primary"):
+        if uploaded_files:
+            with st.spinner("점수를 집계하는 중입니다..."), profiler.span("scores:aggregate"):
+                st.session_state["score_report"] = aggregate_scores(uploaded_files)
+        else:
+            st.warning("집계할 파일을 먼저 올려주세요.")
+
+    report = st.session_state.get("score_report")
+    if report is not None:
+        for error in report.errors:
+            st.error(error)
+        st.success(
+            f"{report.file_count}개 파일, {report.row_count:,}행 중 {report.valid_count:,}행을 집계했습니다 "
+            f"(수험생 {len(report.totals):,}명, {report.seconds:.2f}초)"
+        )
+        if not report.invalid_rows.empty:
+            st.warning(f"배점 검증에 실패한 행이 있어 집계에서 제외했습니다. (예시 {len(report.invalid_rows):,}건)")
+
+        tabs = st.tabs(["수험생별 총점", "대분류별 소계", "중분류별 소계", "평가자 간 편차", "잘못된 행"])
+        tabs[0].dataframe(report.totals, use_container_width=True)
+        tabs[1].dataframe(report.major_subtotals, use_container_width=True)
+        tabs[2].dataframe(report.mid_subtotals, use_container_width=True)
+        with tabs[3]:
+            st.dataframe(report.rater_summary, use_container_width=True)
+            st.dataframe(report.criteria_scores[report.criteria_scores["평가 수"] > 1], use_container_width=True)
+        tabs[4].dataframe(report.invalid_rows, use_container_width=True)
+
+        st.download_button(
+            label="📥 수험생별 총점 다운로드",
+            data=report.totals.to_csv(index=False).encode("utf-8-sig"),
+            file_name=f"수험생별_총점_{datetime.now().strftime('%y%m%d')}.csv",
+            mime="text/csv"
         )
-        st.session_state["problem_table"] = edited_df
+
+elif page == "결과 대시보드":
+    st.header("결과 대시보드")
+
+    if st.session_state.get("score_report") is not None and not st.session_state["score_report"].totals.empty:
+        # plotly 등 무거운 모듈은 이 페이지를 열 때만 불러옴
+        from dashboard import render_dashboard
+
+        render_dashboard(st.session_state["score_report"], plain(st.session_state.get("problem_table")))
     else:
-        st.info("아직 생성된 문제가 없습니다. '출제자 평가 템플릿'에서 '문제 만들기' 버튼을 눌러주세요.")
+        st.info("아직 집계된 점수가 없습니다. '점수 집계' 페이지에서 점수 집계표를 먼저 집계해주세요.")
+
+profiler.stop(page_timer)
+
+# 성능 디버그 패널 (계측을 켠 세션에서만 표시)
+if profiler.enabled:
+    memory = dataframe_memory(st.session_state)
+    run = profiler.end_run(page, memory)
+    with st.sidebar.expander("🛠 성능 디버그"):
+        st.caption(f"이번 실행: {run['total_seconds'] * 1000:.1f} ms")
+        st.dataframe(profiler.summary().round(2), use_container_width=True, hide_index=True)
+        st.dataframe(
+            memory_report(st.session_state).round(1),
+            use_container_width=True,
+            hide_index=True
+        )
+        st.download_button("JSON lines로 내보내기", profiler.to_jsonl(), file_name="profile.jsonl", use_container_width=True)
+        st.download_button("Prometheus 형식으로 내보내기", profiler.to_prometheus(), file_name="profile.prom", use_container_width=True)
 
 # 푸터
 st.markdown("---")
@@ -0,0 +1,139 @@
+"""여러 트랙의 평가 시트를 Streamlit 없이 병렬로 생성하는 배치 도구
+
+입력 디렉토리 구조 (트랙마다 하위 디렉토리 하나):
+
+    tracks/
+        PM/
+            template.csv      # 출제자 평가 템플릿 (.csv 또는 .xlsx, 필수)
+            problem.csv       # 출제자 문제 템플릿 (.csv 또는 .xlsx, 없으면 평가 템플릿에서 생성)
+        UXUI/
+            template.xlsx
+
+실행 예:
+    python batch_export.py tracks --output-dir out --workers 8
+    python batch_export.py tracks --archive sheets.zip --csv
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from exports import excel_filename, write_csv_zip, write_excel_workbook
+from schema import derive_problem_table
+
+INPUT_EXTENSIONS = (".csv", ".xlsx")
+
+
+def find_table(track_dir, stem):
+    """트랙 디렉토리에서 stem.csv 또는 stem.xlsx 경로 찾기"""
+    for ext in INPUT_EXTENSIONS:
+        path = os.path.join(track_dir, stem + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_table(path):
+    """CSV/엑셀 입력을 빈 칸이 NaN이 되지 않도록 읽기"""
+    if path.endswith(".xlsx"):
+        return pd.read_excel(path, sheet_name=0, keep_default_na=False)
+    return pd.read_csv(path, keep_default_na=False)
+
+
+def discover_tracks(input_dir):
+    """평가 템플릿이 있는 트랙 디렉토리 목록"""
+    tracks = []
+    for name in sorted(os.listdir(input_dir)):
+        track_dir = os.path.join(input_dir, name)
+        if os.path.isdir(track_dir) and find_table(track_dir, "template"):
+            tracks.append((name, track_dir))
+    return tracks
+
+
+def export_track(track_name, track_dir, output_dir, with_csv=False):
+    """트랙 하나의 엑셀(과 CSV 묶음)을 생성하고 (트랙명, 파일 목록, 소요 시간) 반환"""
+    start = time.perf_counter()
+    template_df = read_table(find_table(track_dir, "template"))
+    problem_path = find_table(track_dir, "problem")
+    problem_df = read_table(problem_path) if problem_path else derive_problem_table(template_df)
+
+    outputs = []
+    excel_path = os.path.join(output_dir, excel_filename(track_name))
+    with open(excel_path, "wb") as f:
+        write_excel_workbook(template_df, problem_df, f)
+    outputs.append(excel_path)
+
+    if with_csv:
+        prefix = os.path.splitext(os.path.basename(excel_path))[0]
+        csv_path = os.path.join(output_dir, f"{prefix}_CSV.zip")
+        with open(csv_path, "wb") as f:
+            write_csv_zip(template_df, prefix, f)
+        outputs.append(csv_path)
+
+    return track_name, outputs, time.perf_counter() - start
+
+
+def run_batch(tracks, output_dir, workers=None, with_csv=False):
+    """프로세스 풀에서 트랙별 내보내기를 실행하고 (성공, 실패) 목록 반환"""
+    done, failed = [], []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(export_track, name, track_dir, output_dir, with_csv): name
+            for name, track_dir in tracks
+        }
+        for future in as_completed(futures):
+            try:
+                done.append(future.result())
+            except Exception as e:
+                failed.append((futures[future], str(e)))
+    return done, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="트랙별 평가 시트를 병렬로 생성합니다.")
+    parser.add_argument("input_dir", help="트랙별 하위 디렉토리가 있는 입력 디렉토리")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--output-dir", help="생성된 파일을 저장할 디렉토리")
+    target.add_argument("--archive", help="생성된 파일을 모두 담을 ZIP 파일 경로")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="동시에 실행할 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--csv", action="store_true", help="트랙별 CSV 묶음(ZIP)도 함께 생성")
+    args = parser.parse_args(argv)
+
+    tracks = discover_tracks(args.input_dir)
+    if not tracks:
+        print(f"'{args.input_dir}'에서 template 파일이 있는 트랙을 찾지 못했습니다.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        done, failed = run_batch(tracks, args.output_dir, args.workers, args.csv)
+    else:
+        # 워커들이 임시 디렉토리에 쓴 결과를 하나의 아카이브로 묶음 (xlsx는 이미 압축되어 있어 무압축 저장)
+        staging_dir = tempfile.mkdtemp(prefix="kdt_export_")
+        try:
+            done, failed = run_batch(tracks, staging_dir, args.workers, args.csv)
+            with zipfile.ZipFile(args.archive, "w", compression=zipfile.ZIP_STORED) as zf:
+                for _, outputs, _ in sorted(done):
+                    for path in outputs:
+                        zf.write(path, arcname=os.path.basename(path))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    elapsed = time.perf_counter() - start
+
+    for track_name, outputs, seconds in sorted(done):
+        print(f"[완료] {track_name}: {', '.join(os.path.basename(p) for p in outputs)} ({seconds:.2f}s)")
+    for track_name, error in sorted(failed):
+        print(f"[실패] {track_name}: {error}", file=sys.stderr)
+    print(f"{len(done)}/{len(tracks)}개 트랙 처리, {elapsed:.2f}s (workers={args.workers})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
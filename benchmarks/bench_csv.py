@@ -0,0 +1,85 @@
+"""create_csv_files 성능 측정: 기존 iterrows 방식 vs 열 단위 변환 vs ZIP 스트리밍
+
+실행: python benchmarks/bench_csv.py [--sizes 10 1000 100000]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exports import create_csv_files, write_csv_zip  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+
+def make_template(n_rows):
+    """측정용 평가 템플릿 생성"""
+    return pd.DataFrame({
+        "대분류": [f"대분류{i % 5}" for i in range(n_rows)],
+        "중분류": [f"중분류{i % 40}" for i in range(n_rows)],
+        "소분류": [f"소분류 항목 {i}를 충족하는가" for i in range(n_rows)],
+        "평가 내용": ["평가 내용을 구체적으로 작성한 예시 문장입니다"] * n_rows,
+        "배점": [i % 10 + 1 for i in range(n_rows)],
+        "상": ["상급 기준"] * n_rows,
+        "중": ["중급 기준"] * n_rows,
+        "하": ["하급 기준"] * n_rows,
+        "배점 X": ["미달 기준"] * n_rows,
+    })
+
+
+def legacy_create_csv_files(df, filename_prefix):
+    """비교 기준: 변경 전 iterrows 기반 구현"""
+    csv_files = {}
+    csv_files['template'] = df.to_csv(index=False, encoding='utf-8-sig')
+    criteria_data = []
+    for _, row in df.iterrows():
+        criteria_data.append({
+            '대분류': row.get('대분류', ''), '중분류': row.get('중분류', ''), '소분류': row.get('소분류', ''),
+            '상 (90-100점)': row.get('상', ''), '중 (70-89점)': row.get('중', ''),
+            '하 (50-69점)': row.get('하', ''), '미달 (0-49점)': row.get('배점 X', ''), '비고': ''
+        })
+    csv_files['criteria'] = pd.DataFrame(criteria_data).to_csv(index=False, encoding='utf-8-sig')
+    score_data = []
+    for _, row in df.iterrows():
+        score_data.append({
+            '수험생명': '', '대분류': row.get('대분류', ''), '중분류': row.get('중분류', ''),
+            '소분류': row.get('소분류', ''), '배점': row.get('배점', ''), '획득점수': '',
+            '평가자': '', '평가일시': '', '비고': ''
+        })
+    csv_files['score'] = pd.DataFrame(score_data).to_csv(index=False, encoding='utf-8-sig')
+    return True, csv_files
+
+
+def time_call(func, repeat):
+    """repeat회 실행 중 최솟값(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'행 수':>8} | {'기존(ms)':>10} | {'열 단위(ms)':>11} | {'ZIP 스트림(ms)':>14} | {'배속':>6}")
+    for n_rows in args.sizes:
+        df = make_template(n_rows)
+        legacy = time_call(lambda: legacy_create_csv_files(df, "bench"), args.repeat)
+        columnar = time_call(lambda: create_csv_files(df, "bench"), args.repeat)
+        streamed = time_call(lambda: write_csv_zip(df, "bench", io.BytesIO()), args.repeat)
+        print(f"{n_rows:>8} | {legacy * 1000:>10.1f} | {columnar * 1000:>11.1f} | "
+              f"{streamed * 1000:>14.1f} | {legacy / columnar:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
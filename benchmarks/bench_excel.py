@@ -0,0 +1,84 @@
+"""create_excel_file 성능 측정: 기존 pandas ExcelWriter 방식 vs write-only 단일 패스 방식
+
+측정마다 새 프로세스를 띄워 최대 RSS(peak RSS)와 실행 시간을 비교한다.
+실행: python benchmarks/bench_excel.py [--sizes 1000 10000 50000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+
+
+def legacy_write_excel_workbook(template_df, problem_df, output):
+    """비교 기준: 변경 전 pandas ExcelWriter(openpyxl 일반 모드) 구현"""
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        template_df.copy().to_excel(writer, sheet_name='출제자_평가_템플릿', index=False)
+        problem_df.copy().to_excel(writer, sheet_name='출제자_문제_템플릿', index=False)
+        problem_df.copy().to_excel(writer, sheet_name='검수자_문제_템플릿', index=False)
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB, Linux 기준 ru_maxrss는 KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_single(impl, n_rows):
+    """한 구현을 한 번 실행하고 결과를 JSON으로 출력 (자식 프로세스에서 실행)"""
+    from bench_csv import make_template
+    from exports import write_excel_workbook
+    from schema import derive_problem_table
+
+    template_df = make_template(n_rows)
+    problem_df = derive_problem_table(template_df)
+    before = peak_rss_mb()
+
+    write = write_excel_workbook if impl == "single-pass" else legacy_write_excel_workbook
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as output:
+        write(template_df, problem_df, output)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({"seconds": elapsed, "baseline_mb": before, "peak_mb": peak_rss_mb()}))
+
+
+def measure(impl, n_rows):
+    """새 프로세스에서 측정하여 최대 RSS가 이전 측정의 영향을 받지 않게 함"""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", impl, str(n_rows)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--child", nargs=2, metavar=("IMPL", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_single(args.child[0], int(args.child[1]))
+        return
+
+    print(f"{'행 수':>8} | {'구현':>12} | {'시간(s)':>8} | {'최대 RSS(MB)':>12} | {'증가분(MB)':>10}")
+    for n_rows in args.sizes:
+        for impl in ("legacy", "single-pass"):
+            r = measure(impl, n_rows)
+            print(f"{n_rows:>8} | {impl:>12} | {r['seconds']:>8.2f} | {r['peak_mb']:>12.1f} | "
+                  f"{r['peak_mb'] - r['baseline_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""세션 표 메모리 측정: 문자열 열 그대로 vs 공용 카테고리 (동시 작성자 수 산정용)
+
+세션 복원과 같은 방식(JSON 왕복)으로 세션마다 표를 만들어 세션별로 따로 생긴 문자열까지
+tracemalloc으로 잰다.
+
+실행: python benchmarks/bench_memory.py [--sessions 20] [--rows 300 3000]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_csv import make_template  # noqa: E402
+from compact_tables import catalog, compact  # noqa: E402
+from schema import derive_problem_table  # noqa: E402
+
+DEFAULT_SESSIONS = 20
+DEFAULT_ROWS = [300, 3_000]
+CHOICES = {"진행상황": ["진행중", "진행 완료"], "유형": ["코딩테스트", "실무과제", "지필평가"], "난이도": ["상", "중", "하"]}
+
+
+def restored_tables(template, problem):
+    """세션 저장소에서 복원한 것처럼 JSON을 거쳐 세션 고유의 문자열 객체를 가진 표로 만듦"""
+    return tuple(
+        pd.DataFrame(json.loads(json.dumps(df.to_dict("records"), ensure_ascii=False)))
+        for df in (template, problem)
+    )
+
+
+def measure(n_sessions, template, problem, convert):
+    """세션 n_sessions개의 표가 차지하는 메모리(바이트)"""
+    catalog.clear()
+    gc.collect()
+    tracemalloc.start()
+    sessions = []
+    for _ in range(n_sessions):
+        tables = restored_tables(template, problem)
+        sessions.append(tuple(convert(df) for df in tables))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="세션 표 메모리 측정")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    args = parser.parse_args(argv)
+
+    print(f"{'행 수':>6} | {'문자열(KB/세션)':>14} | {'카테고리(KB/세션)':>15} | {'절감':>5} | {'1GB당 세션(문자열→카테고리)':>20}")
+    for rows in args.rows:
+        template = make_template(rows)
+        problem = derive_problem_table(template)
+        for column, options in CHOICES.items():
+            problem[column] = [options[i % len(options)] for i in range(rows)]
+
+        before = measure(args.sessions, template, problem, lambda df: df) / args.sessions
+        after = measure(args.sessions, template, problem, compact) / args.sessions
+        print(f"{rows:>6} | {before / 1024:>14.1f} | {after / 1024:>15.1f} | {1 - after / before:>5.0%} | "
+              f"{2 ** 30 / before:>10,.0f} → {2 ** 30 / after:,.0f}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
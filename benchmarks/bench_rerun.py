@@ -0,0 +1,143 @@
+"""전체 재실행 vs 프래그먼트만 다시 실행할 때의 시간 비교 (Streamlit 서버 없이 실행)
+
+AppTest는 위젯을 조작하면 항상 스크립트 전체를 다시 실행하므로, 같은 방식의 ScriptRunner에
+프래그먼트 id를 넘겨 브라우저에서 프래그먼트 안 위젯을 조작했을 때와 같은 재실행을 만든다.
+시간은 ScriptRunner가 스크립트(또는 프래그먼트)를 실행한 구간만 잰다. 실행 후 사용 통계 수집,
+GC 등 Streamlit이 매 재실행마다 똑같이 치르는 비용은 빠진다.
+
+실행 예:
+    python benchmarks/bench_rerun.py --rows 3000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from urllib import parse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+
+import streamlit.runtime.scriptrunner.script_runner as script_runner_module  # noqa: E402
+import streamlit.testing.v1.app_test as app_test_module  # noqa: E402
+from streamlit.runtime.fragment import MemoryFragmentStorage  # noqa: E402
+from streamlit.runtime.scriptrunner import RerunData  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.testing.v1.element_tree import parse_tree_from_messages  # noqa: E402
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas  # noqa: E402
+
+from bench_csv import make_template  # noqa: E402
+from schema import derive_problem_table  # noqa: E402
+
+PAGES = ["평가표", "출제자 평가 템플릿", "출제자 문제 템플릿"]
+# delta_path 첫 값: 0 = 본문, 1 = 사이드바
+CONTAINERS = {0: "본문 프래그먼트", 1: "사이드바 패널"}
+
+
+class FragmentScriptRunner(LocalScriptRunner):
+    """실행 사이에 프래그먼트 저장소를 공유하고, fragment_ids가 있으면 그 프래그먼트만 실행"""
+
+    storage = MemoryFragmentStorage()
+    fragment_ids = []
+    last = None
+    exec_seconds = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fragment_storage = FragmentScriptRunner.storage
+        FragmentScriptRunner.last = self
+
+    def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+        query_string = parse.urlencode(query_params, doseq=True) if query_params else ""
+        self.request_rerun(RerunData(
+            widget_states=widget_state,
+            query_string=query_string,
+            page_script_hash=page_hash,
+            fragment_id_queue=list(self.fragment_ids),
+        ))
+        if not self._script_thread:
+            self.start()
+        require_widgets_deltas(self, timeout)
+        return parse_tree_from_messages(self.forward_msgs())
+
+
+def _timed_exec(func):
+    """ScriptRunner의 스크립트 실행 구간 시간을 기록하는 래퍼"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            FragmentScriptRunner.exec_seconds = time.perf_counter() - start
+    return wrapper
+
+
+def fragment_ids_by_container(runner):
+    """마지막 전체 실행에서 그려진 프래그먼트 id (본문/사이드바별)"""
+    found = {}
+    for msg in runner.forward_msgs():
+        if msg.HasField("delta") and msg.delta.fragment_id:
+            found.setdefault(msg.metadata.delta_path[0], msg.delta.fragment_id)
+    return found
+
+
+def timed_run(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return FragmentScriptRunner.exec_seconds
+
+
+def measure_page(at, page, repeat):
+    """페이지 하나에서 전체 재실행과 프래그먼트별 재실행의 최소 시간"""
+    at.session_state["current_page"] = page
+    timed_run(at)  # 캐시 채우기
+    best = {"전체 재실행": float("inf")}
+    for _ in range(repeat):
+        best["전체 재실행"] = min(best["전체 재실행"], timed_run(at))
+        for container, fragment_id in sorted(fragment_ids_by_container(FragmentScriptRunner.last).items()):
+            FragmentScriptRunner.fragment_ids = [fragment_id]
+            try:
+                seconds = timed_run(at)
+            finally:
+                FragmentScriptRunner.fragment_ids = []
+            name = CONTAINERS.get(container, f"container {container}")
+            best[name] = min(best.get(name, float("inf")), seconds)
+            # 다음 측정을 위해 전체 트리를 다시 그림
+            timed_run(at)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 재실행 vs 프래그먼트 재실행 시간 비교")
+    parser.add_argument("--rows", type=int, default=3_000, help="평가 템플릿 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    os.environ["KDT_SESSION_DB"] = os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    app_test_module.LocalScriptRunner = FragmentScriptRunner
+    script_runner_module.exec_func_with_error_handling = _timed_exec(
+        script_runner_module.exec_func_with_error_handling
+    )
+
+    template = make_template(args.rows)
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.query_params["sid"] = "bench"
+    at.session_state["session_id"] = "bench"
+    at.session_state["template_table"] = template
+    at.session_state["problem_table"] = derive_problem_table(template)
+
+    print(f"평가 템플릿 {args.rows:,}행")
+    print(f"{'페이지':>14} | {'전체 재실행':>10} | {'본문 프래그먼트':>10} | {'사이드바 패널':>10}")
+    for page in PAGES:
+        best = measure_page(at, page, args.repeat)
+        cells = [best.get(name) for name in ("전체 재실행", "본문 프래그먼트", "사이드바 패널")]
+        print(f"{page:>14} | " + " | ".join(
+            f"{seconds * 1000:>10.1f} ms" if seconds is not None else f"{'-':>13}" for seconds in cells
+        ), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Google 시트 동기화 처리량 측정 (가짜 Sheets 서버 상대로, 네트워크/인증 없이 실행)
+
+트랙 여러 개를 처음 보낼 때(전체 셀)와 몇 행만 고친 뒤 다시 보낼 때(바뀐 범위만)의
+셀/초와 보낸 셀 수를 비교하고, 서버에 저장된 값이 원본 표와 같은지 확인한다.
+
+실행 예:
+    python benchmarks/bench_sheets.py --tracks 20 --rows 300 --latency 0.05 --throttle-every 15
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+
+from bench_csv import make_template  # noqa: E402
+from exports import build_score_frame  # noqa: E402
+from fake_sheets import FakeSheets, start_server  # noqa: E402
+from schema import PROBLEM_SHEET, TEMPLATE_SHEET, derive_problem_table  # noqa: E402
+from sheets_sync import SCORE_SHEET, run_sync, table_grid  # noqa: E402
+
+# 다시 보내기 전에 트랙마다 평가 내용을 고치는 행 수
+EDITED_ROWS = 10
+
+
+def make_jobs(n_tracks, n_rows):
+    jobs = []
+    for i in range(n_tracks):
+        template = make_template(n_rows)
+        tables = {
+            TEMPLATE_SHEET: template,
+            PROBLEM_SHEET: derive_problem_table(template),
+            SCORE_SHEET: build_score_frame(template),
+        }
+        jobs.append((f"트랙{i + 1:02d}", f"sheet-{i + 1:02d}", tables))
+    return jobs
+
+
+def check_contents(sheets, jobs):
+    """서버에 저장된 셀이 보낸 표와 같은지 확인 (빈 칸만 있는 끝 행/열은 비교에서 뺌)"""
+    for _, spreadsheet_id, tables in jobs:
+        for sheet, df in tables.items():
+            grid = table_grid(df)
+            stored = sheets.grid(spreadsheet_id, sheet)
+            n_cols = len(stored[0]) if stored else 0
+            expected = [row[:n_cols] + [""] * (n_cols - len(row)) for row in grid[:len(stored)]]
+            if stored != expected or any(value != "" for row in grid[len(stored):] for value in row):
+                raise AssertionError(f"{spreadsheet_id}/{sheet} 내용이 다릅니다")
+
+
+def timed_sync(jobs, endpoint, concurrency, snapshot_dir):
+    start = time.perf_counter()
+    done, failed, stats = asyncio.run(run_sync(jobs, None, endpoint, concurrency, snapshot_dir, backoff=0.05))
+    if failed:
+        raise RuntimeError(f"동기화 실패: {failed[:3]}")
+    return stats, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Google 시트 동기화 처리량 측정")
+    parser.add_argument("--tracks", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=300, help="트랙별 평가 템플릿 행 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument("--throttle-every", type=int, default=15, help="N번째 요청마다 429 응답 (0이면 없음)")
+    args = parser.parse_args(argv)
+
+    sheets = FakeSheets(args.latency, args.throttle_every, retry_after=0.1)
+    server, endpoint = start_server(sheets)
+    snapshot_dir = tempfile.mkdtemp(prefix="kdt_sheets_")
+    jobs = make_jobs(args.tracks, args.rows)
+
+    print(f"트랙 {args.tracks}개 × 평가 템플릿 {args.rows:,}행, 동시 요청 {args.concurrency}개, "
+          f"요청 지연 {args.latency * 1000:.0f} ms, {args.throttle_every or '-'}번째 요청마다 429")
+    print(f"{'단계':>10} | {'보낸 셀':>10} | {'범위':>6} | {'요청':>4} | {'재시도':>4} | {'시간':>8} | {'셀/s':>10}")
+    for phase in ("처음 보내기", "몇 행 수정 후"):
+        if phase != "처음 보내기":
+            for _, _, tables in jobs:
+                template = tables[TEMPLATE_SHEET]
+                template.loc[template.index[:EDITED_ROWS], "평가 내용"] = "수정한 평가 내용"
+                tables[PROBLEM_SHEET] = derive_problem_table(template)
+        stats, seconds = timed_sync(jobs, endpoint, args.concurrency, snapshot_dir)
+        check_contents(sheets, jobs)
+        print(f"{phase:>10} | {stats.cells:>10,} | {stats.ranges:>6,} | {stats.requests:>4} | {stats.retries:>4} | "
+              f"{seconds:>6.2f} s | {stats.cells / seconds:>10,.0f}", flush=True)
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""sheets_sync.py 시험용 가짜 Sheets API v4 서버 (메모리에 셀 값을 저장)
+
+values:batchUpdate/batchClear, spreadsheets:batchUpdate(addSheet), 시트 목록 조회만 흉내 내고,
+응답 지연과 429/503 응답을 섞어 재시도/백오프 동작과 처리량을 확인할 수 있다.
+
+실행 예:
+    python benchmarks/fake_sheets.py --port 8765 --latency 0.05 --throttle-every 10
+    python sheets_sync.py tracks --sheets sheets.json --endpoint http://127.0.0.1:8765/v4/spreadsheets
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import parse
+
+PATH_PREFIX = "/v4/spreadsheets/"
+A1_PATTERN = re.compile(r"^'((?:[^']|'')*)'!([A-Z]+)(\d+):([A-Z]+)(\d+)$")
+
+
+def column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def parse_a1(a1):
+    """'sheet'!A1:C3 → (시트 이름, 시작 행, 시작 열) (0부터 시작)"""
+    match = A1_PATTERN.match(a1)
+    if not match:
+        raise ValueError(f"지원하지 않는 범위: {a1}")
+    sheet, start_col, start_row = match.group(1).replace("''", "'"), match.group(2), match.group(3)
+    return sheet, int(start_row) - 1, column_index(start_col)
+
+
+class FakeSheets:
+    """스프레드시트 id → {시트 이름: {(행, 열): 값}} 저장소와 요청 통계"""
+
+    def __init__(self, latency=0.0, throttle_every=0, fail_every=0, retry_after=None):
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.fail_every = fail_every
+        self.retry_after = retry_after
+        self.spreadsheets = {}
+        self.requests = 0
+        self.throttled = 0
+        self.cells = 0
+        self._lock = threading.Lock()
+
+    def next_error(self):
+        """이번 요청에 돌려줄 오류 상태 코드 (없으면 None)"""
+        with self._lock:
+            self.requests += 1
+            n = self.requests
+            if self.throttle_every and n % self.throttle_every == 0:
+                self.throttled += 1
+                return 429
+            if self.fail_every and n % self.fail_every == 0:
+                return 503
+        return None
+
+    def sheet_titles(self, spreadsheet_id):
+        with self._lock:
+            return list(self.spreadsheets.get(spreadsheet_id, {}))
+
+    def add_sheets(self, spreadsheet_id, titles):
+        with self._lock:
+            sheets = self.spreadsheets.setdefault(spreadsheet_id, {})
+            for title in titles:
+                if title in sheets:
+                    raise ValueError(f"이미 있는 시트: {title}")
+                sheets[title] = {}
+
+    def update_values(self, spreadsheet_id, data):
+        with self._lock:
+            sheets = self.spreadsheets.setdefault(spreadsheet_id, {})
+            for item in data:
+                sheet, row, col = parse_a1(item["range"])
+                if sheet not in sheets:
+                    raise ValueError(f"없는 시트: {sheet}")
+                cells = sheets[sheet]
+                for i, values in enumerate(item["values"]):
+                    for j, value in enumerate(values):
+                        cells[(row + i, col + j)] = value
+                        self.cells += 1
+
+    def clear_values(self, spreadsheet_id, ranges):
+        with self._lock:
+            sheets = self.spreadsheets.setdefault(spreadsheet_id, {})
+            for a1 in ranges:
+                sheet = a1.split("!")[0][1:-1].replace("''", "'")
+                if sheet not in sheets:
+                    raise ValueError(f"없는 시트: {sheet}")
+                sheets[sheet] = {}
+
+    def grid(self, spreadsheet_id, sheet):
+        """저장된 셀을 빈 칸("")을 뺀 2차원 목록으로 (비교용)"""
+        with self._lock:
+            cells = {key: value for key, value in self.spreadsheets[spreadsheet_id][sheet].items() if value != ""}
+        if not cells:
+            return []
+        n_rows = max(row for row, _ in cells) + 1
+        n_cols = max(col for _, col in cells) + 1
+        return [[cells.get((row, col), "") for col in range(n_cols)] for row in range(n_rows)]
+
+
+def make_handler(sheets):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status, body=None, headers=()):
+            payload = json.dumps(body or {}, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers:
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _spreadsheet_path(self):
+            path = parse.urlsplit(self.path).path
+            if not path.startswith(PATH_PREFIX):
+                return None
+            return parse.unquote(path[len(PATH_PREFIX):])
+
+        def _handle(self, action):
+            if sheets.latency:
+                time.sleep(sheets.latency)
+            status = sheets.next_error()
+            if status is not None:
+                headers = [("Retry-After", str(sheets.retry_after))] if sheets.retry_after is not None else []
+                return self._reply(status, {"error": {"code": status}}, headers)
+            try:
+                self._reply(200, action())
+            except (KeyError, ValueError) as e:
+                self._reply(400, {"error": {"code": 400, "message": str(e)}})
+
+        def do_GET(self):
+            spreadsheet_id = self._spreadsheet_path()
+            if spreadsheet_id is None:
+                return self._reply(404)
+            self._handle(lambda: {"sheets": [
+                {"properties": {"title": title}} for title in sheets.sheet_titles(spreadsheet_id)
+            ]})
+
+        def do_POST(self):
+            path = self._spreadsheet_path()
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if path is None:
+                return self._reply(404)
+            if path.endswith("/values:batchUpdate"):
+                spreadsheet_id = path[:-len("/values:batchUpdate")]
+                return self._handle(lambda: sheets.update_values(spreadsheet_id, body["data"]))
+            if path.endswith("/values:batchClear"):
+                spreadsheet_id = path[:-len("/values:batchClear")]
+                return self._handle(lambda: sheets.clear_values(spreadsheet_id, body["ranges"]))
+            if path.endswith(":batchUpdate"):
+                spreadsheet_id = path[:-len(":batchUpdate")]
+                titles = [request["addSheet"]["properties"]["title"] for request in body["requests"]]
+                return self._handle(lambda: sheets.add_sheets(spreadsheet_id, titles))
+            self._reply(404)
+
+    return Handler
+
+
+def start_server(sheets, port=0):
+    """백그라운드 스레드에서 서버를 띄우고 (서버, Sheets API 주소) 반환"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(sheets))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}{PATH_PREFIX.rstrip('/')}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가짜 Sheets API 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청마다 더할 지연(초)")
+    parser.add_argument("--throttle-every", type=int, default=0, help="N번째 요청마다 429 응답")
+    parser.add_argument("--fail-every", type=int, default=0, help="N번째 요청마다 503 응답")
+    parser.add_argument("--retry-after", type=float, help="429/503 응답의 Retry-After(초)")
+    args = parser.parse_args(argv)
+
+    sheets = FakeSheets(args.latency, args.throttle_every, args.fail_every, args.retry_after)
+    server, endpoint = start_server(sheets, args.port)
+    print(f"가짜 Sheets API: {endpoint} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""app.py 주요 데이터 경로 벤치마크 (Streamlit 서버 없이 실행)
+
+실행 예:
+    python benchmarks/run.py                                  # 전체 측정 → benchmarks/results.json
+    python benchmarks/run.py --save-baseline                  # 결과를 기준값(benchmarks/baseline.json)으로 저장
+    python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 0.2
+    python benchmarks/run.py --cases csv excel --sizes 10 1000
+"""
+import argparse
+import ast
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+
+from bench_csv import make_template, time_call  # noqa: E402
+from compact_tables import compact  # noqa: E402
+from exports import create_csv_files, create_excel_file  # noqa: E402
+from problem_sync import build_problem_index, sync_problem_rows  # noqa: E402
+from rubric_catalog import RubricCatalog  # noqa: E402
+from rubric_search import SEARCH_PAGE_SIZE  # noqa: E402
+from schema import derive_problem_table  # noqa: E402
+from template_table import add_template_rows, build_key_index  # noqa: E402
+
+DEFAULT_SIZES = [10, 1_000, 100_000]
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results.json")
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+# 이 행 수를 넘으면 반복 없이 한 번만 측정
+LARGE_SIZE = 10_000
+# 평가표에서 한 번에 추가하는 행 수
+ADD_BATCH = 10
+
+
+def make_hierarchy(n_rows):
+    """소분류가 n_rows개인 측정용 계층 구조 (대분류 10개, 중분류당 소분류 최대 5개)"""
+    hierarchy = {}
+    for i in range(n_rows):
+        major = f"대분류{i % 10}"
+        mid = f"중분류{(i // 10) // 5}"
+        hierarchy.setdefault(major, {}).setdefault(mid, []).append(f"소분류 항목 {i}를 충족하는가")
+    return hierarchy
+
+
+def bench_catalog(n_rows, repeat):
+    """계층 구조 평탄화와 드롭다운 옵션/표, 검색 색인 생성"""
+    hierarchy = make_hierarchy(n_rows)
+    return time_call(lambda: RubricCatalog("bench", hierarchy), repeat)
+
+
+def bench_search(n_rows, repeat):
+    """평가 항목 검색 한 페이지 (모든 행이 걸리는 넓은 검색어 기준)"""
+    index = RubricCatalog("bench", make_hierarchy(n_rows)).search_index
+    return time_call(lambda: index.search("항목을 충족", 0, SEARCH_PAGE_SIZE), repeat)
+
+
+def bench_template_add(n_rows, repeat):
+    """n_rows행 템플릿에 평가표 행 ADD_BATCH개 추가 (키 인덱스와 공용 카테고리는 이미 있는 상태, 앱과 같은 경로)"""
+    table = compact(make_template(n_rows))
+    catalog = RubricCatalog("bench", make_hierarchy(max(n_rows, ADD_BATCH) + ADD_BATCH))
+    keys = list(catalog.df.tail(ADD_BATCH).itertuples(index=False, name=None))
+    key_index = build_key_index(table)
+    return time_call(lambda: add_template_rows(table, dict(key_index), keys), repeat)
+
+
+def bench_template_index(n_rows, repeat):
+    """표를 직접 편집한 뒤 키 인덱스 재생성"""
+    table = make_template(n_rows)
+    return time_call(lambda: build_key_index(table), repeat)
+
+
+def bench_problem(n_rows, repeat):
+    """처음 '문제 만들기': 빈 문제 템플릿에 평가 템플릿 전체를 동기화 (앱과 같은 sync_problem_rows 경로)"""
+    table = make_template(n_rows)
+    return time_call(lambda: sync_problem_rows(table, None, {}, None), repeat)
+
+
+def bench_problem_sync(n_rows, repeat):
+    """'문제 만들기' 재동기화: 평가 내용을 고친 행 ADD_BATCH개만 문제 템플릿에 반영"""
+    table = make_template(n_rows)
+    problem = derive_problem_table(table)
+    key_index = build_problem_index(problem)
+    edited = table.head(ADD_BATCH).index
+    table.loc[edited, "평가 내용"] = "수정한 평가 내용"
+    dirty = set(table.loc[edited, "소분류"])
+
+    def sync():
+        # 같은 행을 매번 다시 고치도록 문제 템플릿 평가 내용을 되돌림
+        problem.loc[edited, "평가 내용"] = ""
+        return sync_problem_rows(table, problem, key_index, dirty)
+    return time_call(sync, repeat)
+
+
+def bench_csv(n_rows, repeat):
+    table = make_template(n_rows)
+    return time_call(lambda: create_csv_files(table, "bench"), repeat)
+
+
+def bench_excel(n_rows, repeat):
+    table = make_template(n_rows)
+    problem = derive_problem_table(table)
+    return time_call(lambda: create_excel_file(table, problem, "bench"), repeat)
+
+
+CASES = {
+    "catalog": bench_catalog,
+    "search": bench_search,
+    "template_add": bench_template_add,
+    "template_index": bench_template_index,
+    "problem": bench_problem,
+    "problem_sync": bench_problem_sync,
+    "csv": bench_csv,
+    "excel": bench_excel,
+}
+
+
+def app_import_statements():
+    """app.py 최상위 import 문 (앱 시작 시 실제로 불러오는 모듈과 동일하게 유지)"""
+    with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def bench_cold_start(repeat):
+    """새 파이썬 프로세스에서 app.py의 import에 걸리는 시간"""
+    code = "\n".join(app_import_statements())
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        best = min(best, time.perf_counter() - start)
+    # 빈 인터프리터 시작 시간은 빼서 import 비용만 남김
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return max(best - (time.perf_counter() - start), 0.0)
+
+
+def run_benchmarks(cases, sizes, repeat):
+    results = []
+    for case in cases:
+        if case == "cold_start":
+            seconds = bench_cold_start(repeat)
+            results.append({"case": case, "size": 0, "seconds": seconds})
+            print(f"{case:>15} | {'-':>8} | {seconds * 1000:>10.1f} ms", flush=True)
+            continue
+        for size in sizes:
+            seconds = CASES[case](size, repeat if size <= LARGE_SIZE else 1)
+            results.append({"case": case, "size": size, "seconds": seconds})
+            print(f"{case:>15} | {size:>8} | {seconds * 1000:>10.1f} ms", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta):
+    """기준값 대비 threshold 비율 이상, min_delta초 이상 느려진 항목 목록"""
+    previous = {(r["case"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'case':>15} | {'size':>8} | {'기준(ms)':>10} | {'현재(ms)':>10} | {'변화':>7}")
+    for r in results:
+        before = previous.get((r["case"], r["size"]))
+        if before is None:
+            continue
+        change = (r["seconds"] - before) / before if before else 0.0
+        # 수 ms 이하 경로는 측정 잡음이 커서 절대 차이도 함께 확인
+        regressed = change > threshold and r["seconds"] - before > min_delta
+        flag = "  ← 느려짐" if regressed else ""
+        print(f"{r['case']:>15} | {r['size']:>8} | {before * 1000:>10.1f} | {r['seconds'] * 1000:>10.1f} | "
+              f"{change:>+6.0%}{flag}")
+        if regressed:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="app.py 데이터 경로 벤치마크")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES) + ["cold_start"], default=list(CASES) + ["cold_start"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help=f"결과를 {DEFAULT_BASELINE}에도 저장")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 느려짐 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="회귀로 판단할 최소 절대 차이(ms)")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':>15} | {'size':>8} | {'시간':>13}")
+    results = run_benchmarks(args.cases, args.sizes, args.repeat)
+    payload = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    for path in [args.output] + ([DEFAULT_BASELINE] if args.save_baseline else []):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"\n기준 대비 {args.threshold:.0%} 이상 느려진 항목 {len(regressions)}개")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
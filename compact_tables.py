@@ -0,0 +1,124 @@
+import threading
+
+import pandas as pd
+
+# 값이 반복되는 열: 분류 계층과 선택지가 정해진 열
+CATEGORY_COLUMNS = ["대분류", "중분류", "소분류", "진행상황", "유형", "난이도"]
+# 열 하나의 공용 카테고리 상한 (직접 입력한 값이 끝없이 쌓이지 않도록, 넘으면 그 열은 문자열로 둠)
+MAX_CATEGORIES = 50_000
+
+
+class CategoryCatalog:
+    """열별 카테고리를 프로세스 전체에서 공유하는 추가 전용 카탈로그 (기존 값의 코드는 바뀌지 않음)"""
+
+    def __init__(self, max_categories=MAX_CATEGORIES):
+        self.max_categories = max_categories
+        self._dtypes = {}
+        self._lock = threading.Lock()
+
+    def dtype(self, column, values):
+        """values를 모두 담는 열의 CategoricalDtype (상한을 넘으면 None)"""
+        dtype = self._dtypes.get(column)
+        uniques = pd.Index(pd.unique(values.dropna()))
+        if dtype is not None and uniques.isin(dtype.categories).all():
+            return dtype
+
+        with self._lock:
+            dtype = self._dtypes.get(column)
+            categories = dtype.categories if dtype is not None else pd.Index([], dtype=object)
+            missing = uniques[~uniques.isin(categories)]
+            if len(categories) + len(missing) > self.max_categories:
+                return None
+            if len(missing):
+                # 새 값은 뒤에 덧붙여 기존 세션 표의 코드가 그대로 유효하게 함
+                dtype = pd.CategoricalDtype(categories.append(missing.astype(object)))
+                self._dtypes[column] = dtype
+            return dtype
+
+    def nbytes(self):
+        """공용 카테고리가 차지하는 메모리 (문자열 내용 포함)"""
+        return sum(int(dtype.categories.memory_usage(deep=True)) for dtype in self._dtypes.values())
+
+    def clear(self):
+        with self._lock:
+            self._dtypes.clear()
+
+
+catalog = CategoryCatalog()
+
+
+def compact(df):
+    """반복 문자열 열을 공용 카테고리로 변환 (세션 상태에 넣기 전에 사용)"""
+    if df is None:
+        return df
+    converted = {}
+    for column in CATEGORY_COLUMNS:
+        # 이미 카테고리인 열은 예전 버전의 공용 카테고리라도 코드가 그대로 유효하므로 건너뜀
+        if column not in df.columns or isinstance(df[column].dtype, pd.CategoricalDtype):
+            continue
+        dtype = catalog.dtype(column, df[column])
+        if dtype is not None:
+            converted[column] = df[column].astype(dtype)
+    if not converted:
+        return df
+    # assign()은 원래 문자열 블록을 참조한 채로 남을 수 있어, 새 블록으로 복사해 세션 문자열을 놓아줌
+    return pd.DataFrame({column: converted.get(column, df[column]) for column in df.columns}, index=df.index)
+
+
+def append_rows(table, new_rows):
+    """table 뒤에 new_rows를 이어 붙임 (카테고리 열은 공용 카테고리로 맞춰 붙여 카테고리로 유지)"""
+    # 카테고리가 다른 열끼리 이어 붙이면 pandas가 문자열 열로 되돌려 compact()가 모든 행을 다시 훑게 됨
+    old_columns, new_columns = {}, {}
+    for column in table.columns:
+        if column not in new_rows.columns or not isinstance(table[column].dtype, pd.CategoricalDtype):
+            continue
+        dtype = catalog.dtype(column, new_rows[column])
+        if dtype is None:
+            continue
+        if table[column].dtype != dtype:
+            # 카테고리만 바꾸고 값은 코드 재배치로 옮김 (문자열 비교 없음)
+            old_columns[column] = table[column].cat.set_categories(dtype.categories)
+        new_columns[column] = new_rows[column].astype(dtype)
+    if old_columns:
+        table = table.assign(**old_columns)
+    if new_columns:
+        new_rows = new_rows.assign(**new_columns)
+    return pd.concat([table, new_rows])
+
+
+def plain(df):
+    """카테고리 열을 일반 문자열 열로 되돌림 (편집기/내보내기/병합에 넘기기 전에 사용)"""
+    if df is None:
+        return df
+    converted = {
+        column: df[column].astype(object)
+        for column in df.columns
+        if isinstance(df[column].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**converted) if converted else df
+
+
+def table_bytes(df):
+    """세션 하나가 실제로 차지하는 표 메모리 (공용 카테고리는 빼고 코드만 계산)"""
+    total = int(df.index.memory_usage(deep=True))
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            total += series.cat.codes.nbytes
+        else:
+            total += int(series.memory_usage(deep=True, index=False))
+    return total
+
+
+def memory_report(state, table_names=("template_table", "problem_table")):
+    """세션 표별 문자열 그대로일 때와 카테고리로 저장했을 때의 메모리 비교"""
+    rows = []
+    for name in table_names:
+        df = state.get(name)
+        if isinstance(df, pd.DataFrame):
+            before = int(plain(df).memory_usage(deep=True).sum())
+            after = table_bytes(df)
+            rows.append({"표": name, "행 수": len(df), "문자열(KB)": before / 1024, "카테고리(KB)": after / 1024})
+    rows.append({"표": "공용 카테고리 (프로세스 전체)", "행 수": None, "문자열(KB)": None,
+                 "카테고리(KB)": catalog.nbytes() / 1024})
+    return pd.DataFrame(rows)
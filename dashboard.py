@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from export_cache import frame_digest
+
+# 점수 분포 구간 (환산점수 0~100을 5점 단위로)
+SCORE_BINS = np.arange(0, 105, 5)
+# 산점도에 그릴 최대 점 개수
+MAX_SCATTER_POINTS = 5_000
+# 막대 그래프에 표시할 최대 평가자 수
+MAX_RATERS = 50
+
+
+def _binned(values, bins=SCORE_BINS):
+    """서버에서 구간별 개수를 미리 계산 (브라우저로는 구간 수만큼의 행만 보냄)"""
+    counts, edges = np.histogram(np.clip(values, bins[0], bins[-1]), bins=bins)
+    return pd.DataFrame({"구간": [f"{int(lo)}~{int(hi)}" for lo, hi in zip(edges[:-1], edges[1:])], "인원": counts})
+
+
+def _spread_edges(max_score):
+    """평가자 간 편차 구간 경계 (최대 10구간, 구간 이름이 겹치지 않도록 정수 경계만 사용)"""
+    top = np.ceil(max(float(max_score), 1.0))
+    return np.unique(np.linspace(0, top, 11).round())
+
+
+def _grouped_bins(frame, group, value, bins=SCORE_BINS):
+    """그룹(대분류/중분류)별 구간 개수"""
+    labels = [f"{int(lo)}~{int(hi)}" for lo, hi in zip(bins[:-1], bins[1:])]
+    binned = pd.cut(frame[value].clip(bins[0], bins[-1]), bins=bins, labels=labels, include_lowest=True)
+    counts = frame.groupby([frame[group], binned], observed=False).size()
+    return counts.rename("인원").reset_index().rename(columns={value: "구간"})
+
+
+def _downsample(frame, limit=MAX_SCATTER_POINTS):
+    """점이 너무 많으면 고정 시드로 무작위 추출"""
+    return frame.sample(limit, random_state=0) if len(frame) > limit else frame
+
+
+def build_dashboard_data(report, problem_df=None):
+    """대시보드에 필요한 작은 집계표들을 한 번에 계산"""
+    criteria = report.criteria_scores
+    ratio = np.where(criteria["배점"] > 0, criteria["획득점수"] / criteria["배점"] * 100, 0.0)
+    criteria = criteria.assign(환산점수=ratio)
+
+    major = report.major_subtotals
+    major = major.assign(환산점수=np.where(major["배점"] > 0, major["획득점수"] / major["배점"] * 100, 0.0))
+    mid = report.mid_subtotals
+    mid = mid.assign(환산점수=np.where(mid["배점"] > 0, mid["획득점수"] / mid["배점"] * 100, 0.0))
+
+    # 수험생별 총점 vs 평가자 간 평균 편차
+    spread = criteria.groupby("수험생명", sort=False)["편차"].mean().rename("평균 평가자 편차")
+    examinees = report.totals.join(spread, on="수험생명")
+
+    # 소분류별 평균 점수와 난이도(문제 템플릿 기준)
+    items = criteria.groupby("소분류", sort=False).agg(
+        평균_환산점수=("환산점수", "mean"), 평균_편차=("편차", "mean"), 채점_수=("평가 수", "sum")
+    ).reset_index()
+    if problem_df is not None and not problem_df.empty and "난이도" in problem_df.columns:
+        difficulty = problem_df.drop_duplicates("소분류").set_index("소분류")["난이도"].replace("", np.nan)
+        items["난이도"] = items["소분류"].map(difficulty).fillna("미지정")
+    else:
+        items["난이도"] = "미지정"
+
+    return {
+        "total_bins": _binned(report.totals["환산점수"].to_numpy()),
+        "major_bins": _grouped_bins(major, "대분류", "환산점수"),
+        "mid": mid,
+        "spread_bins": _binned(criteria.loc[criteria["평가 수"] > 1, "편차"].to_numpy(),
+                               bins=_spread_edges(criteria["배점"].max())),
+        "raters": report.rater_summary.nlargest(MAX_RATERS, "채점 수"),
+        "examinees": _downsample(examinees[["수험생명", "환산점수", "평균 평가자 편차"]].dropna()),
+        "examinee_count": len(examinees),
+        "items": items,
+        "difficulty": items.groupby("난이도")["평균_환산점수"].agg(["mean", "size"]).reset_index()
+                           .rename(columns={"mean": "평균 환산점수", "size": "소분류 수"}),
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner="대시보드 데이터를 준비하는 중입니다...")
+def _cached_dashboard_data(report_id, problem_key, _report, _problem_df):
+    """보고서/난이도 정보가 바뀌지 않으면 집계를 다시 하지 않음"""
+    return build_dashboard_data(_report, _problem_df)
+
+
+def render_dashboard(report, problem_df=None):
+    """점수 집계 결과 대시보드"""
+    # plotly는 이 페이지를 열 때만 불러와 다른 페이지의 시작 시간을 줄임
+    import plotly.express as px
+
+    problem_key = "none"
+    if problem_df is not None and not problem_df.empty:
+        problem_key = frame_digest(problem_df[["소분류", "난이도"]])
+    data = _cached_dashboard_data(report.report_id, problem_key, report, problem_df)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("수험생 수", f"{len(report.totals):,}명")
+    col2.metric("평균 환산점수", f"{report.totals['환산점수'].mean():.1f}점")
+    col3.metric("집계한 채점 행", f"{report.valid_count:,}행")
+
+    st.subheader("점수 분포")
+    st.plotly_chart(px.bar(data["total_bins"], x="구간", y="인원", title="수험생 환산점수 분포"), use_container_width=True)
+    st.plotly_chart(
+        px.bar(data["major_bins"], x="구간", y="인원", color="대분류", barmode="group", title="대분류별 환산점수 분포"),
+        use_container_width=True
+    )
+    mid = data["mid"]
+    majors = list(mid["대분류"].unique())
+    if majors:
+        selected_major = st.selectbox("중분류 분포를 볼 대분류", majors)
+        st.plotly_chart(
+            px.bar(_grouped_bins(mid[mid["대분류"] == selected_major], "중분류", "환산점수"),
+                   x="구간", y="인원", color="중분류", barmode="group", title=f"{selected_major} 중분류별 환산점수 분포"),
+            use_container_width=True
+        )
+
+    st.subheader("평가자 일치도")
+    col1, col2 = st.columns(2)
+    col1.plotly_chart(
+        px.bar(data["spread_bins"], x="구간", y="인원", title="항목별 평가자 간 점수 차(최고-최저) 분포"),
+        use_container_width=True
+    )
+    col2.plotly_chart(
+        px.bar(data["raters"], x="평가자", y="평균 편차", hover_data=["채점 수", "평균 절대편차"],
+               title="평가자별 평균 편차 (항목 평균 대비)"),
+        use_container_width=True
+    )
+    examinees = data["examinees"]
+    title = "수험생 환산점수 vs 평균 평가자 편차"
+    if len(examinees) < data["examinee_count"]:
+        title += f" (무작위 {len(examinees):,}명 표시)"
+    st.plotly_chart(
+        px.scatter(examinees, x="환산점수", y="평균 평가자 편차", hover_name="수험생명", opacity=0.5, title=title),
+        use_container_width=True
+    )
+
+    st.subheader("난이도와 결과")
+    col1, col2 = st.columns(2)
+    col1.plotly_chart(
+        px.bar(data["difficulty"], x="난이도", y="평균 환산점수", hover_data=["소분류 수"],
+               category_orders={"난이도": ["상", "중", "하", "미지정"]}, title="난이도별 평균 환산점수"),
+        use_container_width=True
+    )
+    col2.plotly_chart(
+        px.scatter(_downsample(data["items"]), x="평균_환산점수", y="평균_편차", color="난이도", hover_name="소분류",
+                   category_orders={"난이도": ["상", "중", "하", "미지정"]}, title="소분류별 평균 점수 vs 평가자 편차"),
+        use_container_width=True
+    )
@@ -0,0 +1,114 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import pandas as pd
+
+from exports import create_excel_file
+
+# 캐시 한도 (프로세스 전체 공유)
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+MAX_CACHE_ENTRIES = 128
+
+
+def frame_digest(df):
+    """표 내용(열 이름 + 열 타입 + 셀 값 + 행 순서)의 빠른 해시, 인덱스는 내보내지 않으므로 제외"""
+    if df is None:
+        return "none"
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode("utf-8"))
+    h.update(repr(list(df.dtypes.astype(str))).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    # 값 해시는 10과 '10'을 같게 보므로 object 열은 셀마다 값의 타입도 함께 해시 (엑셀에서 숫자/문자 칸이 달라짐)
+    # (열 전체가 한 종류면 열마다 타입 이름 하나만, 섞여 있으면 셀마다)
+    for column in df.select_dtypes(include="object").columns:
+        values = df[column]
+        kind = pd.api.types.infer_dtype(values, skipna=False)
+        h.update(kind.encode("utf-8"))
+        if kind.startswith("mixed"):
+            types = values.map(lambda value: type(value).__name__)
+            h.update(pd.util.hash_pandas_object(types, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+class ExportCache:
+    """크기/개수 한도가 있는 LRU 캐시 (같은 키는 동시에 요청돼도 한 번만 생성)"""
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES, max_entries=MAX_CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, data, filename):
+        size = len(data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= len(self._entries.pop(key)[0])
+            self._entries[key] = (data, filename)
+            self.total_bytes += size
+            # 오래 안 쓴 항목부터 제거
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (old_data, _) = self._entries.popitem(last=False)
+                self.total_bytes -= len(old_data)
+
+    def get_or_create(self, key, factory):
+        """캐시에 있으면 반환, 없으면 factory()로 (성공 여부, 데이터, 파일명)을 만들어 저장"""
+        entry = self.get(key)
+        if entry is not None:
+            self.hits += 1
+            return True, entry[0], entry[1]
+
+        # 같은 키를 생성 중인 세션이 있으면 끝날 때까지 기다렸다가 결과를 재사용
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            entry = self.get(key)
+            if entry is not None:
+                self.hits += 1
+                return True, entry[0], entry[1]
+            self.misses += 1
+            success, data, filename = factory()
+            if success:
+                self.put(key, data, filename)
+        with self._lock:
+            self._inflight.pop(key, None)
+        return success, data, filename
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 서버 프로세스 안의 모든 세션이 공유하는 캐시
+excel_cache = ExportCache()
+
+
+def cached_excel_file(template_df, problem_df, track_name=""):
+    """내용이 같으면 이전에 만든 엑셀 파일을 재사용하는 create_excel_file"""
+    key = (
+        frame_digest(template_df),
+        frame_digest(problem_df),
+        track_name.strip(),
+        datetime.now().strftime('%y%m%d'),
+    )
+    return excel_cache.get_or_create(key, lambda: create_excel_file(template_df, problem_df, track_name))
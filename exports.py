@@ -0,0 +1,167 @@
+import io
+import zipfile
+from datetime import datetime
+
+from schema import PROBLEM_SHEET, REVIEW_SHEET, TEMPLATE_SHEET, default_problem, default_template
+
+# 엑셀 변환 시 한 번에 처리할 행 수
+EXCEL_CHUNK_ROWS = 5_000
+
+# 평가 기준표: 원본 열 → 출력 열
+CRITERIA_COLUMNS = {
+    '대분류': '대분류',
+    '중분류': '중분류',
+    '소분류': '소분류',
+    '상': '상 (90-100점)',
+    '중': '중 (70-89점)',
+    '하': '하 (50-69점)',
+    '배점 X': '미달 (0-49점)',
+}
+
+# 점수 집계표 열 순서
+SCORE_COLUMNS = ['수험생명', '대분류', '중분류', '소분류', '배점', '획득점수', '평가자', '평가일시', '비고']
+
+
+def build_criteria_frame(df):
+    """평가 템플릿에서 평가 기준표 생성 (행 단위 반복 없이 열 단위로 변환)"""
+    criteria_df = df.reindex(columns=list(CRITERIA_COLUMNS), fill_value='')
+    return criteria_df.rename(columns=CRITERIA_COLUMNS).assign(비고='').reset_index(drop=True)
+
+
+def build_score_frame(df):
+    """평가 템플릿에서 빈 점수 집계표 생성"""
+    score_df = df.reindex(columns=['대분류', '중분류', '소분류', '배점'], fill_value='')
+    score_df = score_df.assign(수험생명='', 획득점수='', 평가자='', 평가일시='', 비고='')
+    return score_df[SCORE_COLUMNS].reset_index(drop=True)
+
+
+def build_csv_frames(df, filename_prefix):
+    """CSV로 내보낼 3개의 표를 {키: (파일명, 표)} 형태로 반환"""
+    return {
+        'template': (f"{filename_prefix}_출제자평가템플릿.csv", df),
+        'criteria': (f"{filename_prefix}_평가기준표.csv", build_criteria_frame(df)),
+        'score': (f"{filename_prefix}_점수집계표.csv", build_score_frame(df)),
+    }
+
+
+# CSV 다운로드 함수
+def create_csv_files(df, filename_prefix):
+    """평가 템플릿 데이터를 3개의 CSV 파일로 생성"""
+    try:
+        csv_files = {}
+        for key, (filename, frame) in build_csv_frames(df, filename_prefix).items():
+            csv_files[key] = {
+                'data': frame.to_csv(index=False, encoding='utf-8-sig'),
+                'filename': filename
+            }
+        return True, csv_files
+
+    except Exception as e:
+        return False, f"CSV 파일 생성 중 오류가 발생했습니다: {str(e)}"
+
+
+def write_csv_zip(df, filename_prefix, fileobj):
+    """3개의 CSV를 중간 문자열 없이 ZIP 아카이브(파일/스트림)에 바로 기록"""
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for filename, frame in build_csv_frames(df, filename_prefix).values():
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함 UTF-8로 기록
+            with io.TextIOWrapper(zf.open(filename, 'w', force_zip64=True), encoding='utf-8-sig', newline='') as f:
+                frame.to_csv(f, index=False)
+
+
+# CSV 묶음(ZIP) 생성 함수
+def create_csv_zip(df, filename_prefix):
+    """3개의 CSV 파일을 하나의 ZIP 파일로 생성"""
+    try:
+        output = io.BytesIO()
+        write_csv_zip(df, filename_prefix, output)
+        return True, output.getvalue(), f"{filename_prefix}_CSV.zip"
+
+    except Exception as e:
+        return False, None, f"CSV 파일 생성 중 오류가 발생했습니다: {str(e)}"
+
+
+def _has_rows(df):
+    return df is not None and not df.empty
+
+
+def excel_filename(track_name="", date=None):
+    """트랙명과 날짜로 엑셀 파일명 생성"""
+    date = date or datetime.now()
+    if track_name.strip():
+        return f"{track_name.strip()}_{date.strftime('%y%m%d')}.xlsx"
+    return f"스파르타_평가시트_{date.strftime('%y%m%d')}.xlsx"
+
+
+def _header_cells(ws, columns):
+    """pandas 기본 서식처럼 굵은 글씨/테두리/가운데 정렬을 적용한 헤더 셀"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    font = Font(bold=True)
+    border = Border(*(Side(style='thin'),) * 4)
+    alignment = Alignment(horizontal='center', vertical='top')
+    cells = []
+    for column in columns:
+        cell = WriteOnlyCell(ws, value=str(column))
+        cell.font = font
+        cell.border = border
+        cell.alignment = alignment
+        cells.append(cell)
+    return cells
+
+
+def _iter_row_chunks(df, chunk_size=EXCEL_CHUNK_ROWS):
+    """표를 chunk_size 행씩 잘라 엑셀 셀 값(NaN → 빈 칸) 목록으로 변환"""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size].astype(object)
+        yield chunk.where(chunk.notna(), None).values.tolist()
+
+
+def _write_sheets(wb, sheet_names, df):
+    """같은 표를 여러 시트에 기록 (행 변환은 한 번만 하고 각 시트에 재사용)"""
+    sheets = [wb.create_sheet(title=name) for name in sheet_names]
+    for ws in sheets:
+        ws.append(_header_cells(ws, df.columns))
+    for rows in _iter_row_chunks(df):
+        for ws in sheets:
+            for row in rows:
+                ws.append(row)
+
+
+def write_excel_workbook(template_df, problem_df, output):
+    """평가 템플릿과 문제 템플릿을 엑셀 워크북으로 기록 (세션 상태와 무관한 순수 함수)"""
+    # write-only 모드: 행을 청크 단위로 흘려 써서 워크북 전체를 메모리에 올리지 않음
+    # output은 파일 경로나 쓰기 가능한 파일 객체(HTTP 응답 스트림 포함)
+    # openpyxl은 엑셀을 만들 때만 불러와 앱 시작 시간을 줄임
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    # 평가 템플릿 시트
+    if _has_rows(template_df):
+        _write_sheets(wb, [TEMPLATE_SHEET], template_df)
+
+    # 문제 템플릿 시트 (출제자용 / 검수자용을 한 번에)
+    if _has_rows(problem_df):
+        _write_sheets(wb, [PROBLEM_SHEET, REVIEW_SHEET], problem_df)
+
+    # 빈 시트들이 없다면 기본 템플릿 생성
+    if not _has_rows(template_df) and not _has_rows(problem_df):
+        _write_sheets(wb, [TEMPLATE_SHEET], default_template())
+        _write_sheets(wb, [PROBLEM_SHEET], default_problem())
+
+    wb.save(output)
+
+
+# 엑셀 파일 생성 함수
+def create_excel_file(template_df, problem_df, track_name=""):
+    """평가 템플릿과 문제 템플릿을 포함한 엑셀 파일 생성"""
+    try:
+        filename = excel_filename(track_name)
+        output = io.BytesIO()
+        write_excel_workbook(template_df, problem_df, output)
+        return True, output.getvalue(), filename
+
+    except Exception as e:
+        return False, None, f"엑셀 파일 생성 중 오류가 발생했습니다: {str(e)}"
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from schema import PROBLEM_COLUMNS
+from template_table import next_row_label
+
+# 문제 템플릿 행을 평가 템플릿 행과 잇는 키 열과 평가 템플릿에서 가져오는 열
+SYNC_KEY = "소분류"
+SYNC_COLUMN = "평가 내용"
+
+
+def _keys(series):
+    """소분류 열에서 키로 쓸 수 있는 행(빈 칸/NaN 제외) 표시와 object 값"""
+    keys = series.astype(object)
+    return (keys.notna() & (keys != "")).to_numpy(), keys.to_numpy()
+
+
+def build_problem_index(table):
+    """소분류 → 문제 템플릿 행 레이블 인덱스 (소분류가 빈 행은 제외, 중복 키는 첫 행 기준)"""
+    if table is None or SYNC_KEY not in table.columns:
+        return {}
+    valid, keys = _keys(table[SYNC_KEY])
+    labels = table.index[valid]
+    first = ~pd.Index(keys[valid]).duplicated()
+    return dict(zip(keys[valid][first].tolist(), labels[first].tolist()))
+
+
+def sync_problem_rows(template, problem, key_index, dirty=None):
+    """평가 템플릿의 바뀐 소분류만 문제 템플릿에 반영하고 (새 표, 추가 레이블, 갱신 레이블, 빠진 소분류) 반환"""
+    # dirty: 지난 동기화 뒤 평가 템플릿에서 추가/수정/삭제된 소분류 (None이면 전체를 맞춰 봄)
+    # 이미 있는 문제 행은 평가 내용만 제자리에서 고치고 작성한 나머지 열은 건드리지 않음,
+    # 평가 템플릿에서 빠진 소분류도 행을 지우지 않고 목록으로만 돌려줌. key_index는 제자리에서 갱신
+    if problem is None:
+        problem = pd.DataFrame(columns=PROBLEM_COLUMNS)
+    if dirty is None:
+        source = template
+        candidates = set(key_index)
+    else:
+        if not dirty:
+            return problem, [], [], []
+        source = template[template[SYNC_KEY].isin(dirty)]
+        candidates = set(dirty)
+
+    # 같은 소분류가 여러 행이면 첫 행의 평가 내용을 씀 (전체 동기화도 행마다 파이썬 반복 없이 처리)
+    valid, keys = _keys(source[SYNC_KEY])
+    keys = keys[valid]
+    first = ~pd.Index(keys).duplicated()
+    keys = keys[first]
+    contents = source[SYNC_COLUMN].astype(object).to_numpy()[valid][first]
+    contents = np.where(pd.isna(contents), "", contents)
+
+    # 키가 key_index보다 적으면(증분 동기화) dict 조회, 많으면 인덱스 한 번으로 조회 (key_index 키는 중복이 없음)
+    if len(keys) < len(key_index):
+        found = [key_index.get(key, -1) for key in keys.tolist()]
+        labels = np.array(found, dtype=np.int64)
+    else:
+        positions = pd.Index(list(key_index), dtype=object).get_indexer(keys)
+        # 못 찾은 키(-1)는 끝에 붙인 -1을 가리킴
+        labels = np.append(np.fromiter(key_index.values(), dtype=np.int64, count=len(key_index)), -1)[positions]
+    existing = labels >= 0
+    existing_labels = labels[existing]
+    differs = problem.loc[existing_labels, SYNC_COLUMN].to_numpy() != contents[existing]
+    updated = existing_labels[differs].tolist()
+    updated_values = contents[existing][differs].tolist()
+    new_keys = keys[~existing].tolist()
+    new_contents = contents[~existing].tolist()
+    present = set(keys.tolist())
+    removed = [key for key in candidates if key not in present and key in key_index]
+
+    if updated:
+        problem.loc[updated, SYNC_COLUMN] = updated_values
+    if not new_keys:
+        return problem, [], updated, removed
+
+    # 새 문제 행은 기존 레이블에 이어 붙임 (행 단위 저장용 식별자, 편집기에는 RangeIndex로 따로 넘김)
+    start = next_row_label(problem)
+    added = range(start, start + len(new_keys))
+    new_rows = pd.DataFrame(
+        {SYNC_KEY: new_keys, SYNC_COLUMN: new_contents}, index=pd.RangeIndex(start, added.stop)
+    ).reindex(columns=PROBLEM_COLUMNS, fill_value="")
+    key_index.update(zip(new_keys, added))
+    added = list(added)
+    if problem.empty:
+        return new_rows, added, updated, removed
+    return pd.concat([problem, new_rows]), added, updated, removed
@@ -0,0 +1,178 @@
+import functools
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pandas as pd
+
+from compact_tables import table_bytes
+
+# 서버 전체에서 계측을 켜는 환경변수 (세션별로는 URL에 ?debug=1)
+PROFILE_ENV = "KDT_PROFILE"
+# 재실행 기록을 JSON lines로 계속 남길 파일 경로 (선택)
+PROFILE_LOG_ENV = "KDT_PROFILE_LOG"
+# 세션마다 보관할 최근 재실행 수
+HISTORY_SIZE = 50
+
+# 계측이 꺼져 있을 때 돌려주는 공용 빈 컨텍스트 (객체 생성/시간 측정 없음)
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """세션 하나의 재실행별 구간 시간 기록기 (꺼져 있으면 모든 호출이 즉시 반환)"""
+
+    def __init__(self, history=HISTORY_SIZE):
+        self.enabled = False
+        self.runs = deque(maxlen=history)
+        self._spans = {}
+        self._run_start = None
+
+    def begin_run(self, enabled):
+        self.enabled = enabled
+        if enabled:
+            self._spans = {}
+            self._run_start = time.perf_counter()
+
+    def span(self, name):
+        """with 문으로 감싼 구간의 시간을 기록"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def start(self, name):
+        """with 문으로 감싸기 어려운 구간의 시작 (stop과 짝으로 사용)"""
+        if not self.enabled:
+            return None
+        return name, time.perf_counter()
+
+    def stop(self, token):
+        if token is not None:
+            self.record(token[0], time.perf_counter() - token[1])
+
+    def fragment(self, name):
+        """st.fragment 함수용 데코레이터 (프래그먼트만 다시 실행되면 그 실행을 재실행 하나로 기록)"""
+        def decorator(func):
+            # st.fragment가 함수 이름으로 id를 만들므로 원래 이름을 유지
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                if self._run_start is not None:
+                    with _Span(self, name):
+                        return func(*args, **kwargs)
+                self.begin_run(True)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.end_run(None, fragment=name)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        # 같은 이름은 (합계, 횟수)로 묶어서 기록
+        total, count = self._spans.get(name, (0.0, 0))
+        self._spans[name] = (total + seconds, count + 1)
+
+    def end_run(self, page, memory=None, fragment=None):
+        """재실행 하나의 기록을 마무리하고 반환"""
+        if not self.enabled or self._run_start is None:
+            return None
+        run = {
+            "timestamp": time.time(),
+            "page": page,
+            "fragment": fragment,
+            "total_seconds": time.perf_counter() - self._run_start,
+            "spans": {name: {"seconds": total, "count": count} for name, (total, count) in self._spans.items()},
+            "memory_bytes": memory or {},
+        }
+        self.runs.append(run)
+        self._run_start = None
+
+        log_path = os.environ.get(PROFILE_LOG_ENV)
+        if log_path:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(run, ensure_ascii=False) + "\n")
+        return run
+
+    def summary(self):
+        """최근 재실행들의 구간별 호출 수/평균/최대 시간"""
+        rows = []
+        for run in self.runs:
+            rows.append({"구간": _run_label(run), "시간(ms)": run["total_seconds"] * 1000, "호출 수": 1})
+            for name, span in run["spans"].items():
+                rows.append({"구간": name, "시간(ms)": span["seconds"] * 1000, "호출 수": span["count"]})
+        if not rows:
+            return pd.DataFrame(columns=["구간", "재실행 수", "호출 수", "평균(ms)", "최대(ms)", "최근(ms)"])
+        frame = pd.DataFrame(rows)
+        return frame.groupby("구간", sort=False).agg(
+            **{"재실행 수": ("시간(ms)", "size"), "호출 수": ("호출 수", "sum"),
+               "평균(ms)": ("시간(ms)", "mean"), "최대(ms)": ("시간(ms)", "max"), "최근(ms)": ("시간(ms)", "last")}
+        ).reset_index()
+
+    def to_jsonl(self):
+        return "".join(json.dumps(run, ensure_ascii=False) + "\n" for run in self.runs)
+
+    def to_prometheus(self):
+        """최근 재실행 기록을 Prometheus 텍스트 형식으로 변환"""
+        totals = {}
+        for run in self.runs:
+            spans = dict(run["spans"], **{_run_label(run): {"seconds": run["total_seconds"], "count": 1}})
+            for name, span in spans.items():
+                total, count = totals.get(name, (0.0, 0))
+                totals[name] = (total + span["seconds"], count + span["count"])
+
+        lines = [
+            "# HELP kdt_span_seconds Time spent in instrumented app sections.",
+            "# TYPE kdt_span_seconds summary",
+        ]
+        for name, (total, count) in totals.items():
+            label = _escape_label(name)
+            lines.append(f'kdt_span_seconds_sum{{span="{label}"}} {total:.6f}')
+            lines.append(f'kdt_span_seconds_count{{span="{label}"}} {count}')
+        if self.runs:
+            lines.append("# HELP kdt_session_dataframe_bytes Deep memory size of DataFrames in session state.")
+            lines.append("# TYPE kdt_session_dataframe_bytes gauge")
+            for name, size in self.runs[-1]["memory_bytes"].items():
+                lines.append(f'kdt_session_dataframe_bytes{{table="{_escape_label(name)}"}} {size}')
+        return "\n".join(lines) + "\n"
+
+
+def _run_label(run):
+    """전체 재실행은 rerun, 프래그먼트만 다시 실행한 것은 rerun:<프래그먼트 이름>"""
+    return f"rerun:{run['fragment']}" if run.get("fragment") else "rerun"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def is_enabled(query_params):
+    """환경변수나 URL의 ?debug=1로 계측을 켰는지 확인"""
+    return os.environ.get(PROFILE_ENV) == "1" or query_params.get("debug") == "1"
+
+
+def dataframe_memory(state):
+    """세션 상태에 들어 있는 DataFrame별 메모리 사용량(바이트, 공용 카테고리는 제외)"""
+    return {
+        str(key): table_bytes(value)
+        for key, value in state.items()
+        if isinstance(value, pd.DataFrame)
+    }
@@ -0,0 +1,87 @@
+import json
+import os
+import threading
+
+import pandas as pd
+
+from rubric_search import RubricIndex
+
+# 과목별 평가표 파일이 위치한 기본 디렉토리
+RUBRIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rubrics")
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class RubricCatalog:
+    """과목 하나의 평가표 계층과 미리 계산된 인덱스"""
+
+    def __init__(self, name, hierarchy):
+        self.name = name
+        self.hierarchy = hierarchy
+
+        # 대분류 → 중분류 → 소분류 조회용 인덱스
+        self.mids_by_major = {}
+        self.subs_by_mid = {}
+        majors, mids, subs = [], [], []
+        for 대분류, 중분류_dict in hierarchy.items():
+            self.mids_by_major[대분류] = list(중분류_dict.keys())
+            for 중분류, 소분류_list in 중분류_dict.items():
+                self.subs_by_mid[(대분류, 중분류)] = list(소분류_list)
+                majors.extend([대분류] * len(소분류_list))
+                mids.extend([중분류] * len(소분류_list))
+                subs.extend(소분류_list)
+
+        # 드롭다운용 평탄화 옵션 (순서 유지, 중복 제거)
+        self.major_options = list(hierarchy.keys())
+        self.mid_options = list(dict.fromkeys(mids))
+        self.sub_options = list(dict.fromkeys(subs))
+
+        # 화면 표시용 표 (여러 세션이 공유하므로 수정하지 말 것)
+        self.df = pd.DataFrame({"대분류": majors, "중분류": mids, "소분류": subs})
+        # 평가 항목 검색용 n-gram 색인과 표시 문구
+        self.search_index = RubricIndex(self.df)
+
+    def keys_under(self, major, mid=None):
+        """대분류(또는 대분류/중분류) 아래 모든 (대분류, 중분류, 소분류) 키"""
+        mids = [mid] if mid is not None else self.mids_by_major.get(major, [])
+        return [
+            (major, m, sub)
+            for m in mids
+            for sub in self.subs_by_mid.get((major, m), [])
+        ]
+
+    def __len__(self):
+        return len(self.df)
+
+
+def _load_catalog_file(path):
+    """평가표 JSON 파일 하나를 읽어 카탈로그로 변환"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return RubricCatalog(data["name"], data["hierarchy"])
+
+
+def load_catalogs(rubric_dir=RUBRIC_DIR):
+    """디렉토리의 모든 평가표를 프로세스당 한 번만 읽어 {과목명: 카탈로그}로 반환"""
+    rubric_dir = os.path.abspath(rubric_dir)
+    catalogs = _cache.get(rubric_dir)
+    if catalogs is not None:
+        return catalogs
+
+    with _cache_lock:
+        catalogs = _cache.get(rubric_dir)
+        if catalogs is None:
+            catalogs = {}
+            for filename in sorted(os.listdir(rubric_dir)):
+                if filename.endswith(".json"):
+                    catalog = _load_catalog_file(os.path.join(rubric_dir, filename))
+                    catalogs[catalog.name] = catalog
+            _cache[rubric_dir] = catalogs
+    return catalogs
+
+
+def clear_catalog_cache():
+    """평가표 파일을 수정한 뒤 다시 읽어야 할 때 캐시 비우기"""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,105 @@
+import math
+
+import numpy as np
+
+# 검색 결과 한 페이지의 행 수
+SEARCH_PAGE_SIZE = 20
+# 검색어 n-gram 중 이 비율 이상이 일치해야 결과에 포함
+MIN_MATCH_RATIO = 0.5
+# 필드 사이 구분자 (필드 경계를 넘는 n-gram이 검색어와 맞지 않도록)
+FIELD_SEPARATOR = "\x1f"
+SEARCH_FIELDS = ["대분류", "중분류", "소분류"]
+# 유니코드 코드 포인트 비트 수 (bigram 두 글자를 정수 하나로 묶을 때 사용)
+CODE_BITS = 21
+
+
+def _normalize(text):
+    """소문자로 바꾸고 공백을 모두 제거 (한글은 띄어쓰기가 제각각이라 무시)"""
+    return "".join(str(text).lower().split())
+
+
+def _ngrams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _gram_key(gram):
+    """1~2글자 n-gram을 정수 키로 변환 (유니코드 코드 포인트는 21비트 이내)"""
+    if len(gram) == 1:
+        return ord(gram)
+    return (ord(gram[0]) << CODE_BITS | ord(gram[1])) << 1 | 1
+
+
+class RubricIndex:
+    """평가표 행의 대분류/중분류/소분류 글자 n-gram 역색인과 미리 만든 표시 문구"""
+
+    def __init__(self, df):
+        self.size = len(df)
+        # 멀티셀렉트 등에 쓰는 표시 문구 (행마다 df.loc로 다시 찾지 않도록 미리 계산)
+        self.labels = [
+            f"{i + 1}행: {major} / {mid} / {sub}"
+            for i, (major, mid, sub) in enumerate(zip(df["대분류"], df["중분류"], df["소분류"]))
+        ]
+        # 대분류/중분류는 값이 반복되므로 고유값만 정규화
+        fields = [df[field].map({value: _normalize(value) for value in df[field].unique()}) for field in SEARCH_FIELDS]
+        self._texts = [FIELD_SEPARATOR.join(values) for values in zip(*fields)]
+        self._postings = self._build_postings()
+
+    def _build_postings(self):
+        """모든 행의 글자를 코드 포인트 배열로 펼쳐 (n-gram, 행) 쌍을 한 번에 정렬해 역색인 생성"""
+        if not self._texts:
+            return {}
+        joined = FIELD_SEPARATOR.join(self._texts)
+        codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+        lengths = np.fromiter((len(text) + 1 for text in self._texts), dtype=np.int64, count=self.size)
+        rows = np.repeat(np.arange(self.size, dtype=np.int64), lengths)[:len(codes)]
+        separator = ord(FIELD_SEPARATOR)
+
+        # 한 글자 검색어용 unigram과 일반 검색용 bigram (필드 경계를 넘는 것은 제외)
+        single = codes != separator
+        pair = single[:-1] & single[1:]
+        grams = np.concatenate([codes[single], (codes[:-1][pair] << CODE_BITS | codes[1:][pair]) << 1 | 1])
+        gram_rows = np.concatenate([rows[single], rows[:-1][pair]])
+
+        # (n-gram, 행) 순으로 정렬해 같은 쌍은 한 번만 남기고 n-gram별로 나눔
+        order = np.lexsort((gram_rows, grams))
+        grams, gram_rows = grams[order], gram_rows[order]
+        first = np.r_[True, (grams[1:] != grams[:-1]) | (gram_rows[1:] != gram_rows[:-1])]
+        grams, gram_rows = grams[first], gram_rows[first].astype(np.int32)
+        bounds = np.flatnonzero(np.diff(grams)) + 1
+        return dict(zip(grams[np.r_[0, bounds]].tolist(), np.split(gram_rows, bounds)))
+
+    def label(self, position):
+        return self.labels[position]
+
+    def search(self, query, offset=0, limit=SEARCH_PAGE_SIZE):
+        """검색어와 가장 잘 맞는 행 위치 limit개와 전체 결과 수 반환 (빈 검색어는 전체를 순서대로)"""
+        query = _normalize(query).replace(FIELD_SEPARATOR, "")
+        if not query:
+            return np.arange(offset, min(offset + limit, self.size)), self.size
+
+        grams = _ngrams(query, 1 if len(query) == 1 else 2)
+        gram_keys = (_gram_key(gram) for gram in grams)
+        matched = [self._postings[key] for key in gram_keys if key in self._postings]
+        needed = max(1, math.ceil(len(grams) * MIN_MATCH_RATIO))
+        if len(matched) < needed:
+            return np.empty(0, dtype=np.int64), 0
+
+        hits = np.bincount(np.concatenate(matched), minlength=self.size)
+        candidates = np.flatnonzero(hits >= needed)
+        # 검색어가 그대로 들어 있는 행을 먼저, 그다음 일치한 n-gram 수, 같으면 평가표 순서
+        # 검색어 전체가 들어 있으려면 모든 n-gram이 일치해야 하므로 그런 행만 확인
+        # (두 글자 이하 검색어는 n-gram이 곧 검색어라 확인할 필요 없음)
+        exact = hits[candidates] == len(grams)
+        if len(query) > 2:
+            full = np.flatnonzero(exact)
+            exact[full] = [query in self._texts[i] for i in candidates[full]]
+        score = exact * (len(grams) + 1) + hits[candidates]
+        keys = (len(grams) * 2 + 1 - score).astype(np.int64) * (self.size + 1) + candidates
+
+        # 필요한 만큼(offset + limit)만 부분 정렬
+        k = min(offset + limit, len(keys))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), len(keys)
+        top = np.argpartition(keys, k - 1)[:k] if k < len(keys) else np.arange(len(keys))
+        top = top[np.argsort(keys[top])]
+        return candidates[top[offset:]], len(keys)
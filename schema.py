@@ -0,0 +1,83 @@
+import pandas as pd
+
+# 출제자 평가 템플릿 열 (앞 3개: 대분류, 중분류, 소분류)
+TEMPLATE_COLUMNS = [
+    "대분류", "중분류", "소분류",
+    "평가 내용", "배점", "상", "중", "하", "배점 X"
+]
+
+# 출제자 문제 템플릿 열
+PROBLEM_COLUMNS = [
+    "문제명", "하위 기능", "소분류", "평가 내용", "진행상황", "유형", "난이도", "출제 목적", "문제 설명",
+    "필수 요구사항", "선택 요구사항(가산점)", "제약 조건", "요구 기술 스택 및 툴", "제출 형식",
+    "예상 소요시간", "문제 노션 링크", "답안 노션 링크", "출제자 메모"
+]
+
+# 엑셀 시트 이름
+TEMPLATE_SHEET = '출제자_평가_템플릿'
+PROBLEM_SHEET = '출제자_문제_템플릿'
+REVIEW_SHEET = '검수자_문제_템플릿'
+
+
+def default_template():
+    """빈 파일 대신 내보낼 기본 평가 템플릿"""
+    return pd.DataFrame({
+        "대분류": ["예시"],
+        "중분류": ["예시"],
+        "소분류": ["예시 평가 항목"],
+        "평가 내용": ["평가 내용을 입력하세요"],
+        "배점": [10],
+        "상": ["상급 기준"],
+        "중": ["중급 기준"],
+        "하": ["하급 기준"],
+        "배점 X": ["미달 기준"]
+    })
+
+
+def default_problem():
+    """빈 파일 대신 내보낼 기본 문제 템플릿"""
+    return pd.DataFrame({
+        "문제명": ["예시 문제"],
+        "하위 기능": [""],
+        "소분류": ["예시 평가 항목"],
+        "평가 내용": ["평가 내용을 입력하세요"],
+        "진행상황": ["진행중"],
+        "유형": ["실무과제"],
+        "난이도": ["중"],
+        "출제 목적": [""],
+        "문제 설명": [""],
+        "필수 요구사항": [""],
+        "선택 요구사항(가산점)": [""],
+        "제약 조건": [""],
+        "요구 기술 스택 및 툴": [""],
+        "제출 형식": [""],
+        "예상 소요시간": [""],
+        "문제 노션 링크": [""],
+        "답안 노션 링크": [""],
+        "출제자 메모": [""]
+    })
+
+
+def derive_problem_table(template_df):
+    """평가 템플릿에서 소분류/평가 내용만 가져오고 나머지는 공란인 문제 템플릿 생성"""
+    problem_df = pd.DataFrame({
+        "문제명": "",
+        "하위 기능": "",
+        "소분류": template_df["소분류"] if "소분류" in template_df.columns else "",
+        "평가 내용": template_df["평가 내용"] if "평가 내용" in template_df.columns else "",
+        "진행상황": "",
+        "유형": "",
+        "난이도": "",
+        "출제 목적": "",
+        "문제 설명": "",
+        "필수 요구사항": "",
+        "선택 요구사항(가산점)": "",
+        "제약 조건": "",
+        "요구 기술 스택 및 툴": "",
+        "제출 형식": "",
+        "예상 소요시간": "",
+        "문제 노션 링크": "",
+        "답안 노션 링크": "",
+        "출제자 메모": ""
+    })
+    return problem_df[PROBLEM_COLUMNS]
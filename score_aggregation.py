@@ -0,0 +1,256 @@
+"""채점이 끝난 점수 집계표(CSV/xlsx)를 모아 수험생별 점수를 집계
+
+실행 예:
+    python score_aggregation.py scores/*.csv --output-dir report
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from exports import SCORE_COLUMNS
+
+# 한 번에 읽어 들이는 행 수 (메모리 사용량 상한을 정함)
+CHUNK_ROWS = 200_000
+# 보고서에 남길 잘못된 행 예시 개수
+MAX_INVALID_SAMPLES = 1_000
+
+# 집계에 필요한 열
+TEXT_COLUMNS = ['수험생명', '대분류', '중분류', '소분류', '평가자']
+REQUIRED_COLUMNS = TEXT_COLUMNS + ['배점', '획득점수']
+
+
+class _Interner:
+    """문자열 값을 프로세스 안에서 정수 코드로 바꿔 저장 (청크가 달라도 같은 코드 유지)"""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, series):
+        """값마다 코드를 붙임 (앞뒤 공백 제거는 고유값에만 적용하고 빈 칸은 ""로 취급)"""
+        local_codes, uniques = pd.factorize(series.fillna(""))
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for i, value in enumerate(uniques):
+            mapping[i] = self.code(str(value).strip())
+        return mapping[local_codes]
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, codes):
+        return np.asarray(self.values, dtype=object)[codes]
+
+
+class ScoreReport:
+    """점수 집계 결과"""
+
+    def __init__(self):
+        # 화면 쪽 캐시 키로 쓰는 보고서 식별자
+        self.report_id = uuid.uuid4().hex
+        # 집계할 행이 없어도 화면/CSV가 같은 열로 그려지도록 빈 표에도 결과 열을 둠
+        self.totals = pd.DataFrame(columns=['수험생명', '획득점수', '배점', '환산점수', '백분위', '순위'])
+        self.major_subtotals = pd.DataFrame(columns=['수험생명', '대분류', '획득점수', '배점'])
+        self.mid_subtotals = pd.DataFrame(columns=['수험생명', '대분류', '중분류', '획득점수', '배점'])
+        self.criteria_scores = pd.DataFrame(columns=[
+            '수험생명', '대분류', '중분류', '소분류', '획득점수', '최저점', '최고점', '표준편차', '평가 수', '배점', '편차'
+        ])
+        self.rater_summary = pd.DataFrame(columns=['평가자', '채점 수', '평균 편차', '평균 절대편차'])
+        self.invalid_rows = pd.DataFrame(columns=['파일', '행', '사유'])
+        self.errors = []
+        self.row_count = 0
+        self.valid_count = 0
+        self.file_count = 0
+        self.seconds = 0.0
+
+
+def _source_name(source):
+    return source if isinstance(source, str) else getattr(source, "name", "업로드 파일")
+
+
+def _iter_xlsx_chunks(source, chunk_size):
+    """엑셀 첫 시트를 read-only 모드로 chunk_size 행씩 읽기"""
+    # openpyxl은 엑셀 파일을 읽을 때만 불러와 앱 시작 시간을 줄임
+    from openpyxl import load_workbook
+
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = [str(c).strip() if c is not None else "" for c in next(rows, [])]
+        buffer = []
+        for row in rows:
+            buffer.append(row[:len(header)])
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=header)
+                buffer = []
+        if buffer or not header:
+            yield pd.DataFrame(buffer, columns=header)
+    finally:
+        wb.close()
+
+
+def iter_score_chunks(source, chunk_size=CHUNK_ROWS):
+    """점수 집계표 파일 하나를 청크 단위 DataFrame으로 읽기"""
+    if _source_name(source).lower().endswith(".xlsx"):
+        yield from _iter_xlsx_chunks(source, chunk_size)
+    else:
+        yield from pd.read_csv(
+            source, chunksize=chunk_size, encoding='utf-8-sig', dtype=str,
+            keep_default_na=False, usecols=lambda c: c.strip() in REQUIRED_COLUMNS,
+        )
+
+
+def _invalid_reasons(score, max_score, no_examinee):
+    """행마다 검증 실패 사유 (정상이면 빈 문자열)"""
+    return np.select(
+        [
+            no_examinee,
+            max_score.isna() | (max_score < 0),
+            score.isna(),
+            score < 0,
+            score > max_score,
+        ],
+        ["수험생명 없음", "배점 오류", "획득점수 없음/숫자 아님", "획득점수 음수", "획득점수가 배점 초과"],
+        default="",
+    )
+
+
+def aggregate_scores(sources, chunk_size=CHUNK_ROWS):
+    """여러 점수 집계표를 스트리밍으로 읽어 검증하고 집계한 ScoreReport 반환"""
+    start = time.perf_counter()
+    report = ScoreReport()
+    interner = _Interner()
+    codes = {column: [] for column in TEXT_COLUMNS}
+    max_scores, scores, invalid_samples = [], [], []
+
+    for source in sources:
+        name = _source_name(source)
+        report.file_count += 1
+        offset = 0
+        try:
+            for chunk in iter_score_chunks(source, chunk_size):
+                chunk.columns = [str(c).strip() for c in chunk.columns]
+                missing = [c for c in REQUIRED_COLUMNS if c not in chunk.columns]
+                if missing:
+                    report.errors.append(f"{name}: 필수 열이 없습니다 ({', '.join(missing)})")
+                    break
+
+                chunk_codes = {c: interner.encode(chunk[c]) for c in TEXT_COLUMNS}
+                score = pd.to_numeric(chunk['획득점수'], errors='coerce')
+                max_score = pd.to_numeric(chunk['배점'], errors='coerce')
+                no_examinee = chunk_codes['수험생명'] == interner.code("")
+                reasons = _invalid_reasons(score, max_score, no_examinee)
+                valid = reasons == ""
+
+                report.row_count += len(chunk)
+                report.valid_count += int(valid.sum())
+                if not valid.all() and len(invalid_samples) < MAX_INVALID_SAMPLES:
+                    positions = np.flatnonzero(~valid)[:MAX_INVALID_SAMPLES - len(invalid_samples)]
+                    # 헤더 한 줄을 더해 파일에서 보이는 행 번호로 표시
+                    invalid_samples.extend(
+                        (name, offset + int(pos) + 2, reasons[pos]) for pos in positions
+                    )
+
+                for column in TEXT_COLUMNS:
+                    codes[column].append(chunk_codes[column][valid])
+                max_scores.append(max_score[valid].to_numpy(dtype=np.float64))
+                scores.append(score[valid].to_numpy(dtype=np.float64))
+                offset += len(chunk)
+        except Exception as e:
+            report.errors.append(f"{name}: 파일을 읽는 중 오류가 발생했습니다 ({str(e)})")
+
+    if invalid_samples:
+        report.invalid_rows = pd.DataFrame(invalid_samples, columns=['파일', '행', '사유'])
+
+    if report.valid_count:
+        data = pd.DataFrame({column: np.concatenate(codes[column]) for column in TEXT_COLUMNS})
+        data['배점'] = np.concatenate(max_scores)
+        data['획득점수'] = np.concatenate(scores)
+        _summarize(report, data, interner)
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _summarize(report, data, interner):
+    """정수 코드로 된 점수 표를 groupby로 집계해 보고서 채우기"""
+    criterion = ['수험생명', '대분류', '중분류', '소분류']
+
+    # 수험생 × 소분류: 평가자 점수 평균과 평가자 간 편차
+    grouped = data.groupby(criterion, sort=False)
+    criteria = grouped['획득점수'].agg(['mean', 'min', 'max', 'std', 'size'])
+    criteria['배점'] = grouped['배점'].max()
+    criteria = criteria.rename(columns={
+        'mean': '획득점수', 'min': '최저점', 'max': '최고점', 'std': '표준편차', 'size': '평가 수'
+    })
+    criteria['편차'] = criteria['최고점'] - criteria['최저점']
+    criteria = criteria.reset_index()
+
+    # 평가자별: 같은 항목의 평균 대비 얼마나 높게/낮게 채점하는지
+    deviation = data['획득점수'] - grouped['획득점수'].transform('mean')
+    raters = deviation.groupby(data['평가자']).agg(['size', 'mean'])
+    raters['평균 절대편차'] = deviation.abs().groupby(data['평가자']).mean()
+    raters = raters.rename(columns={'size': '채점 수', 'mean': '평균 편차'}).reset_index()
+
+    # 수험생별 총점과 백분위 (배점이 다른 트랙도 견줄 수 있게 환산점수 기준)
+    totals = criteria.groupby('수험생명', sort=False)[['획득점수', '배점']].sum()
+    totals['환산점수'] = np.where(totals['배점'] > 0, totals['획득점수'] / totals['배점'] * 100, 0.0)
+    totals['백분위'] = totals['환산점수'].rank(pct=True) * 100
+    totals['순위'] = totals['환산점수'].rank(ascending=False, method='min').astype(int)
+    totals = totals.reset_index().sort_values('순위', kind='stable')
+
+    # 대분류/중분류 소계
+    major = criteria.groupby(['수험생명', '대분류'], sort=False)[['획득점수', '배점']].sum().reset_index()
+    mid = criteria.groupby(['수험생명', '대분류', '중분류'], sort=False)[['획득점수', '배점']].sum().reset_index()
+
+    # 코드 → 이름 (표시 직전에 한 번만 변환)
+    for frame, columns in [
+        (criteria, criterion), (raters, ['평가자']), (totals, ['수험생명']),
+        (major, ['수험생명', '대분류']), (mid, ['수험생명', '대분류', '중분류']),
+    ]:
+        for column in columns:
+            frame[column] = interner.decode(frame[column].to_numpy())
+
+    report.criteria_scores = criteria
+    report.rater_summary = raters
+    report.totals = totals.reset_index(drop=True)
+    report.major_subtotals = major
+    report.mid_subtotals = mid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점수 집계표 파일들을 모아 수험생별 점수를 집계합니다.")
+    parser.add_argument("files", nargs="+", help=f"점수 집계표 CSV/xlsx 파일 ({', '.join(SCORE_COLUMNS)})")
+    parser.add_argument("--output-dir", default="score_report", help="집계 결과 CSV를 저장할 디렉토리")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="한 번에 읽을 행 수")
+    args = parser.parse_args(argv)
+
+    report = aggregate_scores(args.files, args.chunk_rows)
+    os.makedirs(args.output_dir, exist_ok=True)
+    for filename, frame in [
+        ("수험생별_총점.csv", report.totals),
+        ("대분류별_소계.csv", report.major_subtotals),
+        ("중분류별_소계.csv", report.mid_subtotals),
+        ("항목별_점수.csv", report.criteria_scores),
+        ("평가자별_편차.csv", report.rater_summary),
+        ("잘못된_행.csv", report.invalid_rows),
+    ]:
+        frame.to_csv(os.path.join(args.output_dir, filename), index=False, encoding='utf-8-sig')
+
+    for error in report.errors:
+        print(f"[오류] {error}", file=sys.stderr)
+    print(f"{report.file_count}개 파일, {report.row_count:,}행 중 {report.valid_count:,}행 집계 "
+          f"(수험생 {len(report.totals):,}명), {report.seconds:.2f}s")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+# 세션 표를 저장할 SQLite 파일 (환경변수로 변경 가능)
+DEFAULT_DB_PATH = os.environ.get(
+    "KDT_SESSION_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sessions.sqlite3"),
+)
+# 변경 내용을 모아서 쓰는 간격(초)
+DEBOUNCE_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_tables (
+    session_id TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    columns TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (session_id, table_name)
+);
+CREATE TABLE IF NOT EXISTS session_rows (
+    session_id TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    row_label INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (session_id, table_name, row_label)
+);
+"""
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30)
+    # WAL: 쓰기 중에도 다른 세션의 읽기(복원)가 막히지 않음
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _row_values(df, labels):
+    """지정한 행들을 JSON으로 저장 가능한 값 목록으로 변환 (NaN → None)"""
+    rows = df.loc[list(labels)].astype(object)
+    return rows.where(rows.notna(), None).values.tolist()
+
+
+def editor_row_labels(labels, editor_state, next_label):
+    """RangeIndex로 넘긴 편집기의 편집 상태를 세션 표 행 레이블로 바꿔 (편집 후 레이블, 바뀐 레이블, 삭제된 레이블) 반환"""
+    # 편집 상태의 행 번호는 편집 전 표의 위치이고, 추가된 행은 삭제 반영 후 표 끝에 붙음
+    editor_state = editor_state or {}
+    deleted_rows = sorted(editor_state.get("deleted_rows") or [])
+    deleted = [labels[pos] for pos in deleted_rows]
+    added = list(range(next_label, next_label + len(editor_state.get("added_rows") or [])))
+    deleted_set = set(deleted_rows)
+    changed = [
+        labels[int(pos)] for pos in (editor_state.get("edited_rows") or {})
+        if int(pos) < len(labels) and int(pos) not in deleted_set
+    ]
+    after_labels = labels.delete(deleted_rows).append(pd.Index(added, dtype=labels.dtype))
+    return after_labels, changed + added, deleted
+
+
+class SessionStore:
+    """세션별 표를 행 단위로 저장하는 SQLite 저장소"""
+    # stage()는 변경을 메모리에 모으기만 하고, 백그라운드 스레드 하나가 DEBOUNCE_SECONDS마다
+    # 모인 변경을 트랜잭션 하나로 기록 → 재실행은 디스크 쓰기를 기다리지 않고 세션 간 쓰기 경합도 없음
+
+    def __init__(self, path=DEFAULT_DB_PATH, debounce=DEBOUNCE_SECONDS):
+        self.path = path
+        self.debounce = debounce
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = _connect(path)
+        conn.executescript(SCHEMA)
+        conn.close()
+
+        self._pending = {}
+        self._lock = threading.Lock()
+        # 대기열을 꺼내 기록하는 동안 잡는 잠금 (flush가 쓰기 스레드의 진행 중인 기록까지 기다리도록)
+        self._write_lock = threading.Lock()
+        self._writer = None
+
+    def stage(self, session_id, table_name, df, changed_labels=(), deleted_labels=(), replace=False):
+        """바뀐 행만 저장 대기열에 추가 (replace=True면 기존 행을 모두 지우고 df 전체를 저장)"""
+        if replace:
+            changed_labels = df.index
+        upserts = dict(zip(changed_labels, _row_values(df, changed_labels))) if len(changed_labels) else {}
+        # 레이블은 여기서 정수로 바꿔 둠 (정수가 아니면 백그라운드 쓰기가 아니라 호출한 쪽에서 오류가 나도록)
+        upserts = {int(label): values for label, values in upserts.items()}
+        deleted_labels = [int(label) for label in deleted_labels]
+
+        with self._lock:
+            pending = self._pending.get((session_id, table_name))
+            if pending is None or replace:
+                pending = {"replace": replace, "upserts": {}, "deletes": set()}
+                self._pending[(session_id, table_name)] = pending
+            pending["columns"] = list(df.columns)
+            for label in deleted_labels:
+                pending["upserts"].pop(label, None)
+                pending["deletes"].add(label)
+            for label, values in upserts.items():
+                pending["deletes"].discard(label)
+                pending["upserts"][label] = values
+        self._ensure_writer()
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._run, name="session-store-writer", daemon=True)
+                    self._writer.start()
+
+    def _run(self):
+        conn = _connect(self.path)
+        while True:
+            time.sleep(self.debounce)
+            try:
+                self._write(conn)
+            except Exception:
+                # 쓰기 스레드가 죽으면 이후 모든 세션의 자동 저장이 멈추므로 기록만 하고 다음 주기에 다시 시도
+                # (잠금 대기 초과, 디스크 부족 등. 실패한 변경은 _write가 대기열에 되돌려 둠)
+                logger.exception("세션 저장소 쓰기 실패, %s초 뒤 다시 시도합니다", self.debounce)
+                conn.close()
+                conn = _connect(self.path)
+
+    def _requeue(self, pending):
+        """쓰지 못한 변경을 대기열에 되돌림 (그 사이 새로 들어온 변경이 우선)"""
+        with self._lock:
+            for key, change in pending.items():
+                newer = self._pending.get(key)
+                if newer is None:
+                    self._pending[key] = change
+                    continue
+                if newer["replace"]:
+                    continue
+                change["columns"] = newer["columns"]
+                for label in newer["deletes"]:
+                    change["upserts"].pop(label, None)
+                    change["deletes"].add(label)
+                for label, values in newer["upserts"].items():
+                    change["deletes"].discard(label)
+                    change["upserts"][label] = values
+                self._pending[key] = change
+
+    def _write(self, conn):
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                self._write_pending(conn, pending)
+            except Exception:
+                self._requeue(pending)
+                raise
+
+    def _write_pending(self, conn, pending):
+        now = time.time()
+        with conn:
+            for (session_id, table_name), change in pending.items():
+                if change["replace"]:
+                    conn.execute(
+                        "DELETE FROM session_rows WHERE session_id = ? AND table_name = ?",
+                        (session_id, table_name),
+                    )
+                conn.execute(
+                    "INSERT OR REPLACE INTO session_tables VALUES (?, ?, ?, ?)",
+                    (session_id, table_name, json.dumps(change["columns"], ensure_ascii=False), now),
+                )
+                conn.executemany(
+                    "DELETE FROM session_rows WHERE session_id = ? AND table_name = ? AND row_label = ?",
+                    [(session_id, table_name, label) for label in change["deletes"]],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO session_rows VALUES (?, ?, ?, ?)",
+                    [
+                        (session_id, table_name, label, json.dumps(values, ensure_ascii=False, default=str))
+                        for label, values in change["upserts"].items()
+                    ],
+                )
+
+    def flush(self):
+        """대기 중인 변경을 즉시 기록 (종료 시/측정용)"""
+        conn = _connect(self.path)
+        try:
+            self._write(conn)
+        finally:
+            conn.close()
+
+    def load_tables(self, session_id):
+        """세션에 저장된 표들을 {표 이름: DataFrame}으로 복원"""
+        # 아직 기록되지 않은 변경을 먼저 기록 (DEBOUNCE_SECONDS 안에 새로고침해도 최근 편집이 빠지지 않도록)
+        self.flush()
+        conn = _connect(self.path)
+        try:
+            tables = {}
+            for table_name, columns in conn.execute(
+                "SELECT table_name, columns FROM session_tables WHERE session_id = ?", (session_id,)
+            ):
+                rows = conn.execute(
+                    "SELECT row_label, data FROM session_rows "
+                    "WHERE session_id = ? AND table_name = ? ORDER BY row_label",
+                    (session_id, table_name),
+                ).fetchall()
+                labels = [label for label, _ in rows]
+                # 레이블이 연속이면 RangeIndex로 복원 (편집기에는 레이블과 상관없이 RangeIndex로 넘김)
+                if labels and labels[-1] - labels[0] == len(labels) - 1:
+                    labels = pd.RangeIndex(labels[0], labels[-1] + 1)
+                tables[table_name] = pd.DataFrame(
+                    [json.loads(data) for _, data in rows],
+                    columns=json.loads(columns),
+                    index=labels,
+                )
+            return tables
+        finally:
+            conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """서버 프로세스 안에서 공유하는 저장소"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore()
+                atexit.register(_store.flush)
+    return _store
@@ -0,0 +1,381 @@
+"""트랙별 평가/문제/점수 집계 표를 Google 스프레드시트로 보내는 동기화 도구
+
+트랙마다 지난번에 보낸 표를 스냅샷으로 남겨 두고, 바뀐 셀 범위만 values:batchUpdate 한 번에 모아
+보낸다. 여러 트랙은 asyncio로 동시에 보내고 429/5xx 응답은 Retry-After 또는 지수 백오프로 다시 시도한다.
+
+입력 디렉토리 구조는 batch_export.py와 같고 (scores.csv/xlsx가 있으면 점수 집계표로 보냄),
+트랙 → 스프레드시트 id 대응은 JSON 파일로 받는다.
+
+    {"PM": "1AbC...", "UXUI": "1XyZ..."}
+
+실행 예:
+    python sheets_sync.py tracks --sheets sheets.json --credentials credentials.json
+    python sheets_sync.py tracks --sheets sheets.json --endpoint http://127.0.0.1:8765/v4/spreadsheets
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pandas as pd
+
+from batch_export import discover_tracks, find_table, read_table
+from exports import build_score_frame
+from schema import PROBLEM_SHEET, TEMPLATE_SHEET, derive_problem_table
+
+SHEETS_API = "https://sheets.googleapis.com/v4/spreadsheets"
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+SCORE_SHEET = "점수_집계표"
+# 지난번에 보낸 표 (스프레드시트마다 JSON 하나)
+SNAPSHOT_DIR = os.environ.get(
+    "KDT_SHEETS_SNAPSHOTS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sheets_snapshots"),
+)
+# 동시에 보내는 요청 수 (Sheets API 분당 쓰기 한도를 넘지 않도록 작게 유지)
+DEFAULT_CONCURRENCY = 8
+# 요청 하나에 담는 셀 수 상한 (요청 본문이 너무 커지지 않도록)
+MAX_CELLS_PER_REQUEST = 50_000
+# 같은 행에서 이 열 수 이하로 떨어진 변경은 범위 하나로 묶음 (범위 수를 줄이는 쪽이 더 쌈)
+MERGE_GAP = 2
+MAX_RETRIES = 6
+BACKOFF_BASE = 1.0
+MAX_BACKOFF = 64.0
+REQUEST_TIMEOUT = 60
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def column_letter(index):
+    """0부터 시작하는 열 번호 → A1 표기의 열 문자 (0 → A, 26 → AA)"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def a1_range(sheet, row, col, n_rows, n_cols):
+    """시트 이름과 0부터 시작하는 위치로 'sheet'!A1:C3 범위 문자열 만들기"""
+    title = "'" + sheet.replace("'", "''") + "'"
+    start = f"{column_letter(col)}{row + 1}"
+    end = f"{column_letter(col + n_cols - 1)}{row + n_rows}"
+    return f"{title}!{start}:{end}"
+
+
+# 그대로 보내는 값 종류 (숫자는 숫자 그대로 보내 시트 수식에서 쓸 수 있게 함)
+PLAIN_VALUE_TYPES = {"string", "integer", "floating", "mixed-integer-float", "empty"}
+
+
+def _cell_value(value):
+    return value if isinstance(value, (str, int, float)) else str(value)
+
+
+def table_grid(df):
+    """표를 헤더를 포함한 2차원 값 목록으로 변환 (빈 칸/NaN은 "", 날짜 등은 문자열)"""
+    df = df.astype(object).where(df.notna(), "")
+    for column in df.columns:
+        if pd.api.types.infer_dtype(df[column], skipna=True) not in PLAIN_VALUE_TYPES:
+            df[column] = df[column].map(_cell_value)
+    return [[str(column) for column in df.columns]] + df.values.tolist()
+
+
+def _column_runs(columns):
+    """바뀐 열 번호들을 MERGE_GAP 이내끼리 묶은 (시작, 끝) 구간"""
+    runs = []
+    start = end = columns[0]
+    for col in columns[1:]:
+        if col - end > MERGE_GAP + 1:
+            runs.append((start, end))
+            start = col
+        end = col
+    runs.append((start, end))
+    return runs
+
+
+def changed_ranges(sheet, previous, current):
+    """지난번 표와 비교해 바뀐 셀만 담은 values:batchUpdate 범위 목록"""
+    # 행 단위로 먼저 비교하고 (대부분 같으므로) 다른 행만 셀 단위로 비교함
+    # 줄어든 부분은 ""로 덮어써 지워지게 하고, 같은 열 구간이 이어지는 행은 범위 하나로 묶음
+    previous = previous or []
+    blocks = []  # [시작 행, 행 수, 시작 열, 끝 열]
+    for row in range(max(len(previous), len(current))):
+        before = previous[row] if row < len(previous) else []
+        after = current[row] if row < len(current) else []
+        if before == after:
+            continue
+        width = max(len(before), len(after))
+        before = before + [""] * (width - len(before))
+        after = after + [""] * (width - len(after))
+        columns = [col for col in range(width) if before[col] != after[col]]
+        if not columns:
+            continue
+        for start, end in _column_runs(columns):
+            block = blocks[-1] if blocks else None
+            if block and block[0] + block[1] == row and block[2:] == [start, end]:
+                block[1] += 1
+            else:
+                blocks.append([row, 1, start, end])
+
+    def values(row, count, start, end):
+        rows = current[row:row + count]
+        rows = rows + [[]] * (count - len(rows))
+        return [(line[start:end + 1] + [""] * (end + 1 - start))[:end + 1 - start] for line in rows]
+
+    return [
+        {"range": a1_range(sheet, row, start, count, end - start + 1), "values": values(row, count, start, end)}
+        for row, count, start, end in blocks
+    ]
+
+
+def _cell_count(data):
+    return sum(len(item["values"]) * len(item["values"][0]) for item in data)
+
+
+def split_requests(data, max_cells=MAX_CELLS_PER_REQUEST):
+    """범위 목록을 요청 하나에 max_cells개 이하가 되도록 나눔 (큰 범위 하나는 그대로 한 요청)"""
+    batches, batch, cells = [], [], 0
+    for item in data:
+        size = _cell_count([item])
+        if batch and cells + size > max_cells:
+            batches.append(batch)
+            batch, cells = [], 0
+        batch.append(item)
+        cells += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def service_account_token(credentials_path):
+    """서비스 계정 JSON으로 액세스 토큰을 돌려주는 함수 생성 (만료되면 다시 발급)"""
+    # google-auth는 시트 동기화에만 필요하므로 여기서 불러옴
+    try:
+        from google.auth.transport.requests import Request
+        from google.oauth2 import service_account
+    except ImportError as e:
+        raise RuntimeError("Google 시트 동기화에는 google-auth 패키지가 필요합니다 (pip install google-auth)") from e
+
+    credentials = service_account.Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+    lock = threading.Lock()
+
+    def token():
+        with lock:
+            if not credentials.valid:
+                credentials.refresh(Request())
+            return credentials.token
+    return token
+
+
+class SyncStats:
+    """동기화 전체의 요청/재시도/셀 수 집계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.cells = 0
+        self.ranges = 0
+
+
+class SheetsClient:
+    """Sheets API v4 호출 (urllib 요청은 스레드에서 실행하고 재시도/동시 요청 수는 여기서 관리)"""
+
+    def __init__(self, token=None, endpoint=SHEETS_API, concurrency=DEFAULT_CONCURRENCY,
+                 max_retries=MAX_RETRIES, backoff=BACKOFF_BASE):
+        self.token = token
+        self.endpoint = endpoint.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.stats = SyncStats()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def _send(self, method, url, body=None):
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        if self.token is not None:
+            headers["Authorization"] = f"Bearer {self.token()}"
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        request = urllib.request.Request(url, data=data, headers=headers, method=method)
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return json.loads(response.read() or b"{}")
+
+    def _retry_delay(self, attempt, error):
+        """Retry-After 헤더가 있으면 그만큼, 없으면 지수 백오프 + 지터"""
+        retry_after = error.headers.get("Retry-After") if isinstance(error, urllib.error.HTTPError) else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(MAX_BACKOFF, self.backoff * 2 ** attempt) + random.uniform(0, self.backoff)
+
+    async def request(self, method, path, body=None):
+        url = f"{self.endpoint}/{path}"
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                self.stats.requests += 1
+                try:
+                    return await asyncio.to_thread(self._send, method, url, body)
+                except urllib.error.HTTPError as e:
+                    if e.code not in RETRY_STATUS or attempt == self.max_retries:
+                        detail = e.read().decode("utf-8", "replace")[:200]
+                        raise RuntimeError(f"Sheets API {e.code} 오류: {detail}") from e
+                    error = e
+                except (urllib.error.URLError, TimeoutError) as e:
+                    if attempt == self.max_retries:
+                        raise RuntimeError(f"Sheets API에 연결하지 못했습니다 ({e})") from e
+                    error = e
+            # 기다리는 동안은 세마포어를 놓아 다른 트랙 요청이 진행되게 함
+            self.stats.retries += 1
+            await asyncio.sleep(self._retry_delay(attempt, error))
+
+    async def sheet_titles(self, spreadsheet_id):
+        path = f"{urllib.parse.quote(spreadsheet_id)}?fields=sheets.properties.title"
+        result = await self.request("GET", path)
+        return [sheet["properties"]["title"] for sheet in result.get("sheets", [])]
+
+    async def add_sheets(self, spreadsheet_id, titles):
+        body = {"requests": [{"addSheet": {"properties": {"title": title}}} for title in titles]}
+        await self.request("POST", f"{urllib.parse.quote(spreadsheet_id)}:batchUpdate", body)
+
+    async def clear_values(self, spreadsheet_id, sheets):
+        body = {"ranges": ["'" + sheet.replace("'", "''") + "'" for sheet in sheets]}
+        await self.request("POST", f"{urllib.parse.quote(spreadsheet_id)}/values:batchClear", body)
+
+    async def update_values(self, spreadsheet_id, data):
+        """바뀐 범위들을 values:batchUpdate로 보냄 (MAX_CELLS_PER_REQUEST씩 나눠서)"""
+        path = f"{urllib.parse.quote(spreadsheet_id)}/values:batchUpdate"
+        for batch in split_requests(data):
+            await self.request("POST", path, {"valueInputOption": "RAW", "data": batch})
+            self.stats.ranges += len(batch)
+            self.stats.cells += _cell_count(batch)
+
+
+def track_tables(track_dir):
+    """트랙 디렉토리에서 {시트 이름: 표} 읽기 (문제/점수 표가 없으면 평가 템플릿에서 만듦)"""
+    template_df = read_table(find_table(track_dir, "template"))
+    problem_path = find_table(track_dir, "problem")
+    score_path = find_table(track_dir, "scores")
+    return {
+        TEMPLATE_SHEET: template_df,
+        PROBLEM_SHEET: read_table(problem_path) if problem_path else derive_problem_table(template_df),
+        SCORE_SHEET: read_table(score_path) if score_path else build_score_frame(template_df),
+    }
+
+
+def snapshot_path(spreadsheet_id, snapshot_dir=SNAPSHOT_DIR):
+    return os.path.join(snapshot_dir, f"{urllib.parse.quote(spreadsheet_id, safe='')}.json")
+
+
+def load_snapshot(spreadsheet_id, snapshot_dir=SNAPSHOT_DIR):
+    """지난번에 보낸 {시트 이름: 표} (처음이면 빈 dict)"""
+    try:
+        with open(snapshot_path(spreadsheet_id, snapshot_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_snapshot(spreadsheet_id, grids, snapshot_dir=SNAPSHOT_DIR):
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = snapshot_path(spreadsheet_id, snapshot_dir)
+    # json.dump는 순수 파이썬 인코더를 쓰므로 dumps(C 인코더)로 만든 문자열을 한 번에 씀
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(json.dumps(grids, ensure_ascii=False))
+    os.replace(path + ".tmp", path)
+
+
+async def sync_track(client, track_name, spreadsheet_id, tables, snapshot_dir=SNAPSHOT_DIR):
+    """트랙 하나의 표를 스냅샷과 비교해 바뀐 범위만 보내고 (트랙명, 보낸 셀 수, 소요 시간) 반환"""
+    start = time.perf_counter()
+    previous = load_snapshot(spreadsheet_id, snapshot_dir)
+    grids = {sheet: table_grid(df) for sheet, df in tables.items()}
+
+    # 스냅샷에 없는 시트는 스프레드시트에도 없을 수 있으니 한 번 확인해 탭을 만들고,
+    # 이미 있던 탭은 손으로 올린 값이 섞이지 않도록 비운 뒤 빈 표와 비교해 보냄
+    unknown = [sheet for sheet in grids if sheet not in previous]
+    if unknown:
+        existing = set(await client.sheet_titles(spreadsheet_id))
+        missing = [sheet for sheet in unknown if sheet not in existing]
+        if missing:
+            await client.add_sheets(spreadsheet_id, missing)
+        if len(missing) < len(unknown):
+            await client.clear_values(spreadsheet_id, [sheet for sheet in unknown if sheet in existing])
+
+    data = [item for sheet, grid in grids.items() for item in changed_ranges(sheet, previous.get(sheet), grid)]
+    if data:
+        await client.update_values(spreadsheet_id, data)
+    # 스냅샷은 모두 보낸 뒤에만 바꿈 (중간에 실패하면 다음 실행에서 다시 비교)
+    if data or previous.keys() != grids.keys():
+        save_snapshot(spreadsheet_id, grids, snapshot_dir)
+    return track_name, _cell_count(data), time.perf_counter() - start
+
+
+async def sync_tracks(client, jobs, snapshot_dir=SNAPSHOT_DIR):
+    """(트랙명, 스프레드시트 id, 표) 목록을 동시에 동기화하고 (성공, 실패) 목록 반환"""
+    results = await asyncio.gather(
+        *(sync_track(client, name, spreadsheet_id, tables, snapshot_dir) for name, spreadsheet_id, tables in jobs),
+        return_exceptions=True,
+    )
+    done, failed = [], []
+    for (name, _, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            failed.append((name, str(result)))
+        else:
+            done.append(result)
+    return done, failed
+
+
+async def run_sync(jobs, token=None, endpoint=SHEETS_API, concurrency=DEFAULT_CONCURRENCY,
+                   snapshot_dir=SNAPSHOT_DIR, backoff=BACKOFF_BASE):
+    """클라이언트를 만들어 동기화하고 (성공, 실패, 통계) 반환"""
+    client = SheetsClient(token, endpoint, concurrency, backoff=backoff)
+    done, failed = await sync_tracks(client, jobs, snapshot_dir)
+    return done, failed, client.stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="트랙별 평가 시트를 Google 스프레드시트로 동기화합니다.")
+    parser.add_argument("input_dir", help="트랙별 하위 디렉토리가 있는 입력 디렉토리")
+    parser.add_argument("--sheets", required=True, help="트랙 → 스프레드시트 id JSON 파일")
+    parser.add_argument("--credentials", default="credentials.json", help="서비스 계정 키 JSON")
+    parser.add_argument("--endpoint", help="Sheets API 주소 (테스트용 가짜 서버를 쓸 때, 인증 없이 호출)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시에 보내는 요청 수")
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR, help="지난번에 보낸 표를 저장할 디렉토리")
+    args = parser.parse_args(argv)
+
+    with open(args.sheets, encoding="utf-8") as f:
+        spreadsheet_ids = json.load(f)
+    tracks = [(name, track_dir) for name, track_dir in discover_tracks(args.input_dir) if name in spreadsheet_ids]
+    if not tracks:
+        print(f"'{args.input_dir}'에서 스프레드시트가 지정된 트랙을 찾지 못했습니다.", file=sys.stderr)
+        return 1
+
+    token = None if args.endpoint else service_account_token(args.credentials)
+    jobs = [(name, spreadsheet_ids[name], track_tables(track_dir)) for name, track_dir in tracks]
+
+    start = time.perf_counter()
+    done, failed, stats = asyncio.run(run_sync(
+        jobs, token, args.endpoint or SHEETS_API, args.concurrency, args.snapshot_dir
+    ))
+    elapsed = time.perf_counter() - start
+
+    for track_name, cells, seconds in sorted(done):
+        print(f"[완료] {track_name}: {cells:,}셀 ({seconds:.2f}s)")
+    for track_name, error in sorted(failed):
+        print(f"[실패] {track_name}: {error}", file=sys.stderr)
+    print(
+        f"{len(done)}/{len(tracks)}개 트랙, 범위 {stats.ranges:,}개 · {stats.cells:,}셀, "
+        f"요청 {stats.requests}회(재시도 {stats.retries}회), {elapsed:.2f}s, "
+        f"{stats.cells / elapsed if elapsed else 0:,.0f}셀/s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import pandas as pd
+
+from compact_tables import append_rows, compact
+from schema import TEMPLATE_COLUMNS
+
+# 평가 템플릿 행을 식별하는 키 열
+TEMPLATE_KEY = ["대분류", "중분류", "소분류"]
+
+
+def build_key_index(table):
+    """(대분류, 중분류, 소분류) → 행 위치 인덱스 (중복 키는 첫 행 기준)"""
+    key_index = {}
+    keys = zip(*(table[column] for column in TEMPLATE_KEY)) if len(table) else []
+    for position, key in enumerate(keys):
+        key_index.setdefault(key, position)
+    return key_index
+
+
+def next_row_label(table):
+    """표에 새로 붙일 행의 레이블 (기존 최대 레이블 + 1)"""
+    return int(table.index.max()) + 1 if len(table) else 0
+
+
+def add_template_rows(table, key_index, keys):
+    """템플릿에 없는 키만 빈 평가 항목으로 추가하고 (새 표, 추가된 행 수) 반환"""
+    # 이미 있는 행은 건드리지 않으므로 작성 중인 내용이 유지됨, key_index는 제자리에서 갱신
+    new_keys = []
+    for key in keys:
+        key = tuple(key)
+        if key not in key_index:
+            key_index[key] = len(table) + len(new_keys)
+            new_keys.append(key)
+
+    if not new_keys:
+        return table, 0
+
+    # 기존 행의 레이블은 그대로 두고 새 행은 이어지는 레이블을 받음 (행 단위 저장 시 식별자로 사용)
+    start = next_row_label(table)
+    new_rows = pd.DataFrame(new_keys, columns=TEMPLATE_KEY, index=range(start, start + len(new_keys)))
+    new_rows = new_rows.reindex(columns=TEMPLATE_COLUMNS, fill_value="")
+    # 반환하는 표는 분류 열이 공용 카테고리인 상태라 호출한 쪽에서 표 전체를 다시 compact하지 않아도 됨
+    if table.empty:
+        return compact(new_rows), len(new_keys)
+    return append_rows(table, new_rows), len(new_keys)
@@ -0,0 +1,223 @@
+"""검토가 끝난 평가 시트(xlsx)를 다시 불러와 평가/문제 템플릿에 병합
+
+실행 예:
+    python workbook_import.py reviews/ --output merged.xlsx --workers 8
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from exports import write_excel_workbook
+from schema import PROBLEM_COLUMNS, PROBLEM_SHEET, REVIEW_SHEET, TEMPLATE_COLUMNS, TEMPLATE_SHEET
+from template_table import next_row_label
+
+# 시트별 필수 열
+SHEET_COLUMNS = {
+    TEMPLATE_SHEET: TEMPLATE_COLUMNS,
+    PROBLEM_SHEET: PROBLEM_COLUMNS,
+    REVIEW_SHEET: PROBLEM_COLUMNS,
+}
+# 병합 기준 열
+MERGE_KEY = "소분류"
+# 이 개수 이하의 파일은 프로세스 풀 없이 바로 읽음
+INLINE_LIMIT = 2
+
+
+def _read_sheet(ws, columns):
+    """read-only 시트를 행 단위로 읽어 필요한 열만 DataFrame으로 변환"""
+    rows = ws.iter_rows(values_only=True)
+    header = [str(c).strip() if c is not None else "" for c in next(rows, [])]
+    missing = [c for c in columns if c not in header]
+    if missing:
+        return None, missing
+    positions = [header.index(c) for c in columns]
+    data = [
+        ["" if i >= len(row) or row[i] is None else row[i] for i in positions]
+        for row in rows
+        if any(cell is not None and cell != "" for cell in row)
+    ]
+    return pd.DataFrame(data, columns=columns, dtype=object), []
+
+
+def parse_workbook(source):
+    """워크북 하나를 읽어 (이름, {시트: DataFrame}, 오류 목록) 반환"""
+    # source는 파일 경로 또는 (이름, 바이트/파일 객체) 튜플 (프로세스 풀에는 경로나 바이트만 넘김)
+    # openpyxl은 가져오기를 실행할 때만 불러와 앱 시작 시간을 줄임
+    from openpyxl import load_workbook
+
+    name, content = (os.path.basename(source), source) if isinstance(source, str) else source
+    if isinstance(content, bytes):
+        content = io.BytesIO(content)
+    sheets, errors = {}, []
+    try:
+        wb = load_workbook(content, read_only=True, data_only=True)
+        try:
+            for sheet_name, columns in SHEET_COLUMNS.items():
+                if sheet_name not in wb.sheetnames:
+                    continue
+                frame, missing = _read_sheet(wb[sheet_name], columns)
+                if missing:
+                    errors.append(f"{name} / {sheet_name}: 필수 열이 없습니다 ({', '.join(missing)})")
+                else:
+                    sheets[sheet_name] = frame
+        finally:
+            wb.close()
+    except Exception as e:
+        errors.append(f"{name}: 파일을 읽는 중 오류가 발생했습니다 ({str(e)})")
+    if not sheets and not errors:
+        errors.append(f"{name}: 가져올 시트가 없습니다 ({', '.join(SHEET_COLUMNS)})")
+    return name, sheets, errors
+
+
+def parse_workbooks(sources, workers=1):
+    """여러 워크북을 읽어 입력 순서대로 결과 반환 (workers가 2 이상이면 프로세스 풀에서 병렬로)"""
+    # 앱(Streamlit 서버) 안에서는 기본값 1로 순서대로 읽음: 여러 스레드가 도는 서버 프로세스를
+    # fork하지 않고, 업로드 파일 내용을 워커로 보내려고 한 번 더 복사하지도 않음. 프로세스 풀은 CLI용
+    sources = list(sources)
+    if len(sources) <= INLINE_LIMIT or workers == 1:
+        return [parse_workbook(source) for source in sources]
+    # 작은 파일이 많을 때 프로세스 간 통신 횟수를 줄이도록 묶어서 전달
+    chunksize = max(1, len(sources) // ((workers or os.cpu_count() or 1) * 4))
+    # fork는 부모의 스레드 상태(잠금 등)를 그대로 복제하므로 spawn으로 새 인터프리터를 띄움
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+        return list(pool.map(parse_workbook, sources, chunksize=chunksize))
+
+
+def _last_filled(values):
+    """빈 칸을 건너뛴 마지막 값"""
+    filled = values[values.astype(str) != ""]
+    return filled.iloc[-1] if len(filled) else ""
+
+
+def merge_by_key(table, updates, columns, key=MERGE_KEY):
+    """key 열 기준으로 병합해 (병합된 표, 바뀐 행 레이블, 수정 행 수, 추가 행 수) 반환"""
+    # 칸 단위로 병합: 빈 칸은 기존 값을 유지하고, 같은 칸을 여러 파일에서 고쳤다면 나중 파일 값을 사용
+    if table is None:
+        table = pd.DataFrame(columns=columns)
+    updates = updates[updates[key].astype(str) != ""]
+    if updates.empty:
+        return table, [], 0, 0
+
+    first_rows = table[key].drop_duplicates(keep="first")
+    label_by_key = pd.Series(first_rows.index, index=first_rows.values)
+    existing = updates[key].isin(label_by_key.index).to_numpy()
+
+    merged = table.copy()
+    updated = updates[existing]
+    target_labels = label_by_key.loc[updated[key]].to_numpy()
+    touched = set()
+    for column in columns:
+        if column == key or column not in merged.columns:
+            continue
+        new_text = updated[column].astype(str).to_numpy()
+        current = merged.loc[target_labels, column].astype(str).to_numpy()
+        # 값이 있고 기존 값과 다른 칸만 덮어씀
+        filled = (new_text != "") & (new_text != current)
+        if not filled.any():
+            continue
+        cells = pd.Series(updated[column].to_numpy()[filled], index=target_labels[filled])
+        cells = cells[~cells.index.duplicated(keep="last")]
+        if merged[column].dtype != object:
+            merged[column] = merged[column].astype(object)
+        merged.loc[cells.index, column] = cells.to_numpy()
+        touched.update(cells.index)
+
+    # 표에 없는 키는 파일들의 값을 칸 단위로 합쳐 새 행으로 추가
+    added = (
+        updates[~existing].groupby(key, sort=False).agg(_last_filled)
+        .reset_index().reindex(columns=list(merged.columns), fill_value="")
+    )
+    if not added.empty:
+        start = next_row_label(merged)
+        added.index = pd.RangeIndex(start, start + len(added))
+        merged = pd.concat([merged, added]) if not merged.empty else added
+
+    changed_labels = [label for label in merged.index if label in touched] + list(added.index)
+    return merged, changed_labels, len(touched), len(added)
+
+
+def collect_updates(results):
+    """워크북별 결과를 시트 종류별 변경 목록으로 모음 (검수자 시트가 출제자 시트보다 우선)"""
+    template_parts, problem_parts, errors = [], [], []
+    for _, sheets, sheet_errors in results:
+        errors.extend(sheet_errors)
+        if TEMPLATE_SHEET in sheets:
+            template_parts.append(sheets[TEMPLATE_SHEET])
+        for sheet_name in (PROBLEM_SHEET, REVIEW_SHEET):
+            if sheet_name in sheets:
+                problem_parts.append(sheets[sheet_name])
+    template_updates = pd.concat(template_parts, ignore_index=True) if template_parts else None
+    problem_updates = pd.concat(problem_parts, ignore_index=True) if problem_parts else None
+    return template_updates, problem_updates, errors
+
+
+def import_workbooks(sources, template_df=None, problem_df=None, workers=1):
+    """워크북들을 읽어 평가/문제 템플릿에 병합하고 결과 요약을 dict로 반환"""
+    start = time.perf_counter()
+    results = parse_workbooks(sources, workers)
+    template_updates, problem_updates, errors = collect_updates(results)
+
+    summary = {"files": len(results), "errors": errors, "template": None, "problem": None}
+    if template_updates is not None:
+        merged, changed, updated, added = merge_by_key(template_df, template_updates, TEMPLATE_COLUMNS)
+        summary["template"] = {"table": merged, "changed": changed, "updated": updated, "added": added}
+    if problem_updates is not None:
+        merged, changed, updated, added = merge_by_key(problem_df, problem_updates, PROBLEM_COLUMNS)
+        summary["problem"] = {"table": merged, "changed": changed, "updated": updated, "added": added}
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def find_workbooks(paths):
+    """파일/디렉토리 경로 목록에서 xlsx 파일 찾기 (엑셀 임시 파일 제외)"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".xlsx") and not name.startswith("~$"):
+                    found.append(os.path.join(path, name))
+        else:
+            found.append(path)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="검토된 평가 시트들을 하나로 병합합니다.")
+    parser.add_argument("paths", nargs="+", help="xlsx 파일 또는 xlsx 파일이 있는 디렉토리")
+    parser.add_argument("--base", help="병합 기준이 될 원본 평가 시트(xlsx)")
+    parser.add_argument("--output", required=True, help="병합 결과를 저장할 xlsx 경로")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="동시에 실행할 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    template_df = problem_df = None
+    if args.base:
+        _, sheets, errors = parse_workbook(args.base)
+        for error in errors:
+            print(f"[오류] {error}", file=sys.stderr)
+        template_df = sheets.get(TEMPLATE_SHEET)
+        problem_df = sheets.get(PROBLEM_SHEET)
+
+    workbooks = find_workbooks(args.paths)
+    summary = import_workbooks(workbooks, template_df, problem_df, args.workers)
+    template = summary["template"]["table"] if summary["template"] else template_df
+    problem = summary["problem"]["table"] if summary["problem"] else problem_df
+    write_excel_workbook(template, problem, args.output)
+
+    for error in summary["errors"]:
+        print(f"[오류] {error}", file=sys.stderr)
+    for label, part in (("평가 템플릿", summary["template"]), ("문제 템플릿", summary["problem"])):
+        if part:
+            print(f"{label}: {part['updated']}행 수정, {part['added']}행 추가")
+    print(f"{summary['files']}개 워크북 병합, {summary['seconds']:.2f}s → {args.output}")
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())